@@ -1,16 +1,18 @@
+import asyncio
+import logging
+
 from fastapi import HTTPException
 from fastapi import status
 from sqlalchemy.future import select
 
 from app.auth import hashing
 from app.models import auth_models
-from app.utils.logging import setup_logging
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Define user authentication functions
@@ -35,8 +37,7 @@ async def check_user_exists(db, username):
 
     try:
         query = select(auth_models.User).where(auth_models.User.username == username)
-        result = await db.execute(query)
-        user = result.scalars().first()
+        user = await db.scalar(query)
 
         if not user:
             logger.warning(f"API user '{username}' not found in database")
@@ -75,7 +76,8 @@ async def authenticate_user(db, username, password):
 
     user = await check_user_exists(db, username)
 
-    if user and hashing.verify_password(password, user.hashed_password):
+    # bcrypt is CPU bound, verify in worker thread to keep event loop responsive
+    if user and await asyncio.to_thread(hashing.verify_password, password, user.hashed_password):
         logger.info(f"API user '{username}' exists and credentials are valid")
         return user
 
@@ -1,3 +1,7 @@
+import logging
+
+from typing import Annotated
+
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import status
@@ -5,15 +9,15 @@ from fastapi.security import OAuth2PasswordBearer
 
 from app.auth import authenticate
 from app.auth import token
+from app.auth import user_cache
 from app.database import db_connect
 from app.schemas import auth_schemas
-from app.utils.logging import setup_logging
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Set up OAuth2 password bearer
@@ -29,6 +33,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="get-token")
 async def active_user(db=Depends(db_connect.get_db), access_token=Depends(oauth2_scheme)):
     """
     Fetches current user based on provided token.
+    User is cached in user_cache between requests, token itself is decoded on
+    every request so expiry is still enforced.
 
     Parameters:
         db (AsyncSession): Async database session.
@@ -45,19 +51,25 @@ async def active_user(db=Depends(db_connect.get_db), access_token=Depends(oauth2
 
     username = token.decode_token(access_token)
 
-    user = await authenticate.check_user_exists(db, username)
+    async def load_user(username):
+        db_user = await authenticate.check_user_exists(db, username)
+        return None if db_user is None else auth_schemas.User(**db_user.__dict__)
+
+    user = await user_cache.get(username, load_user)
 
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = auth_schemas.User(**user.__dict__)
-
     logger.info(f"API user '{user.username}' authenticated, admin status is'{user.is_admin}'")
 
     return user
 
 
-async def admin_user(current_user: auth_schemas.User = Depends(active_user)):
+# Authenticated user dependency, resolved once per request
+ActiveUser = Annotated[auth_schemas.User, Depends(active_user, use_cache=True)]
+
+
+async def admin_user(current_user: ActiveUser):
     """
     Checks if current user has admin status.
 
@@ -80,3 +92,7 @@ async def admin_user(current_user: auth_schemas.User = Depends(active_user)):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=error_message)
 
     return current_user
+
+
+# Authenticated admin user dependency, shares active_user resolution of request
+AdminUser = Annotated[auth_schemas.User, Depends(admin_user, use_cache=True)]
@@ -1,15 +1,19 @@
+import asyncio
+import logging
+
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.future import select
 
 from app.auth import hashing
+from app.auth import user_cache
 from app.models import auth_models
-from app.utils.logging import setup_logging
 from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Create admin user
@@ -21,9 +25,10 @@ async def create_admin_user(db):
     Creates admin user in database if doesn't already exist.
 
     Checks if an admin user already exists in database.
-    If yes, logs message and skips creation process.
-    If no, creates new admin user by hashing str password,
-    adding User object (id, username, hashed_password, is_admin) to database
+    If yes, logs message and skips creation process, including password hashing.
+    If no, hashes str password and inserts User object (id, username,
+    hashed_password, is_admin) with single INSERT ... ON DUPLICATE KEY UPDATE,
+    so workers starting at same time cannot fail on unique username.
 
     Parameters:
         db (AsyncSession): Async database session.
@@ -39,23 +44,28 @@ async def create_admin_user(db):
 
     try:
         query = select(auth_models.User).where(auth_models.User.username == Settings.API_ADM_USER)
-        user = await db.execute(query)  # Check if admin user already exists
-        admin_user = user.scalars().first()
+        admin_user = await db.scalar(query)  # Check if admin user already exists
 
         if admin_user:
             logger.warning(
-                f"Admin user '{Settings.API_ADM_USER}' already exists, skipping creation."
+                "Admin user '%s' already exists, skipping creation.", Settings.API_ADM_USER
             )
         else:
-            hashed_password = hashing.hash_password(Settings.API_ADM_PASSWORD)
-            admin_user = auth_models.User(
+            # bcrypt is CPU bound, hash in worker thread to keep event loop responsive
+            hashed_password = await asyncio.to_thread(
+                hashing.hash_password, Settings.API_ADM_PASSWORD
+            )
+            query = insert(auth_models.User).values(
                 username=Settings.API_ADM_USER, hashed_password=hashed_password, is_admin=True
             )
-            db.add(admin_user)
+            # No-op update keeps row created by concurrent worker unchanged
+            query = query.on_duplicate_key_update(username=query.inserted.username)
+            await db.execute(query)
             logger.debug("Admin user added to database")
             await db.commit()
-            logger.info(f"Admin user '{Settings.API_ADM_USER}' created successfully.")
+            user_cache.invalidate(Settings.API_ADM_USER)
+            logger.info("Admin user '%s' created successfully.", Settings.API_ADM_USER)
 
     except Exception as e:
-        logger.error(f"Error creating admin user: {str(e)}")
+        logger.error("Error creating admin user: %s", e)
         raise
@@ -1,12 +1,12 @@
-from passlib.hash import bcrypt
+import logging
 
-from app.utils.logging import setup_logging
+from passlib.hash import bcrypt
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Define hashing functions
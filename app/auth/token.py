@@ -1,20 +1,55 @@
+import base64
+import hmac
+import logging
+
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
 
+import orjson
+
 from fastapi import HTTPException
 from fastapi import status
 from jose import JWTError
 from jose import jwt
 
-from app.utils.logging import setup_logging
 from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Precomputed token signing state
+# ------------------------------
+
+HMAC_DIGESTS = {"HS256": "sha256", "HS384": "sha384", "HS512": "sha512"}
+
+
+def b64url_encode(segment):
+    """
+    Base64url encodes segment without padding, as required by JWT.
+
+    Parameters:
+        segment (bytes): Segment to encode.
+
+    Returns:
+        bytes: Encoded segment.
+    """
+    return base64.urlsafe_b64encode(segment).rstrip(b"=")
+
+
+if Settings.TOKEN_ALGORITHM in HMAC_DIGESTS and Settings.TOKEN_SECRET_KEY:
+    # Header is identical for every token, encode it once
+    TOKEN_HEADER = b64url_encode(orjson.dumps({"alg": Settings.TOKEN_ALGORITHM, "typ": "JWT"}))
+    # Keyed HMAC prototype, copied per token instead of re-deriving key state
+    TOKEN_SIGNER = hmac.new(
+        Settings.TOKEN_SECRET_KEY.encode(), digestmod=HMAC_DIGESTS[Settings.TOKEN_ALGORITHM]
+    )
+else:
+    TOKEN_HEADER = TOKEN_SIGNER = None  # Non-HMAC algorithm, sign with jose
 
 # ------------------------------
 # Define authentication functions
@@ -42,10 +77,9 @@ def create_access_token(data, expires_delta=timedelta(Settings.TOKEN_EXPIRE_MINU
     try:
         to_encode = data.copy()
         expire = datetime.now(UTC) + expires_delta
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(
-            to_encode, Settings.TOKEN_SECRET_KEY, algorithm=Settings.TOKEN_ALGORITHM
-        )  # Create access token using username, expiration time, and secret key
+        to_encode.update({"exp": int(expire.timestamp())})
+        # Create access token using username, expiration time, and secret key
+        encoded_jwt = encode_token(to_encode)
 
         logger.debug(
             "Encoding complete. Access token created for API user " f"'{data.get('sub')}'"
@@ -60,6 +94,30 @@ def create_access_token(data, expires_delta=timedelta(Settings.TOKEN_EXPIRE_MINU
         )
 
 
+def encode_token(claims):
+    """
+    Encodes and signs claims as JWT.
+
+    HMAC tokens reuse precomputed header and keyed signer, so only payload is
+    encoded per call. Other algorithms are delegated to jose.
+
+    Parameters:
+        claims (dict): Claims to be encoded in token.
+
+    Returns:
+        str: Encoded JWT.
+    """
+
+    if TOKEN_SIGNER is None:
+        return jwt.encode(claims, Settings.TOKEN_SECRET_KEY, algorithm=Settings.TOKEN_ALGORITHM)
+
+    signing_input = TOKEN_HEADER + b"." + b64url_encode(orjson.dumps(claims))
+    signer = TOKEN_SIGNER.copy()
+    signer.update(signing_input)
+
+    return (signing_input + b"." + b64url_encode(signer.digest())).decode()
+
+
 def decode_token(token):
     """
     Decodes provided token and extracts username.
@@ -0,0 +1,86 @@
+"""
+Script to set up in-process cache of authenticated API users.
+"""
+
+import asyncio
+import logging
+
+from hashlib import blake2b
+
+from cachetools import TTLCache
+
+from config import Settings
+
+# ------------------------------
+# Set up logging
+# ------------------------------
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Sharded user cache
+# ------------------------------
+
+"""
+Users are spread over SHARD_COUNT TTL caches, each guarded by own lock, so
+lookups of different users rarely wait on each other, while concurrent
+lookups of same user wait for single database read instead of each doing one.
+"""
+
+SHARD_COUNT = 64  # Must be power of two
+
+shards = [
+    TTLCache(maxsize=Settings.USER_CACHE_SIZE, ttl=Settings.USER_CACHE_TTL)
+    for _ in range(SHARD_COUNT)
+]
+locks = [asyncio.Lock() for _ in range(SHARD_COUNT)]
+
+
+def shard_index(username):
+    """
+    Returns index of shard holding given user.
+
+    Parameters:
+        username (str): Username.
+
+    Returns:
+        int: Shard index.
+    """
+    return blake2b(username.encode(), digest_size=1).digest()[0] & (SHARD_COUNT - 1)
+
+
+async def get(username, load):
+    """
+    Returns cached user, loading and caching it on miss.
+
+    Parameters:
+        username (str): Username.
+        load (Callable): Coroutine function returning user for username, or None.
+
+    Returns:
+        user (schema.User): Cached or loaded user, None if user does not exist.
+    """
+
+    index = shard_index(username)
+
+    async with locks[index]:
+        user = shards[index].get(username)
+
+        if user is None:
+            user = await load(username)
+
+            if user is not None:
+                shards[index][username] = user
+                logger.debug("User '%s' cached", username)
+
+    return user
+
+
+def invalidate(username):
+    """
+    Removes user from cache, called when user is created or changed.
+
+    Parameters:
+        username (str): Username.
+    """
+    shards[shard_index(username)].pop(username, None)
@@ -1,16 +1,18 @@
+import logging
+
 from fastapi import HTTPException
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth import user_cache
 from app.models import auth_models
 from app.schemas import auth_schemas
-from app.utils.logging import setup_logging
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Authentication and Authorisation
@@ -40,6 +42,7 @@ async def create_api_user(db: AsyncSession, user: auth_schemas.UserCreate):
         db.add(db_user)
         await db.commit()
         await db.refresh(db_user)
+        user_cache.invalidate(user.username)
 
         message = f"API user '{user.username}' created successfully"
         logger.info(message)
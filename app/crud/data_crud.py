@@ -1,19 +1,28 @@
+import logging
 import math
 
+from decimal import Decimal
+from functools import lru_cache
+
+import orjson
+
 from fastapi import HTTPException
 from fastapi import status
+from sqlalchemy import TextClause
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas import auth_schemas
 from app.schemas import data_schemas
-from app.utils.logging import setup_logging
+from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Database CRUD Operations
@@ -53,12 +62,12 @@ async def create_database(db: AsyncSession, database: data_schemas.DatabaseCreat
 
         if "1007" in str(e):
             error_message = f"Database '{database.db_name}' already exists"
-            logger.warning(error_message + f": {str(e.orig)}")
+            logger.warning("%s: %s", error_message, e.orig)
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error_message)
 
         else:
             error_message = f"Error occurred creating database '{database.db_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, e.orig)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_message
             )
@@ -110,7 +119,7 @@ async def create_db_user(db: AsyncSession, user: auth_schemas.DBUserCreate):
     except Exception as e:
         await db.rollback()
         error_message = f"Error occurred creating DB user '{user.username}'"
-        logger.error(error_message + f": {str(e.orig)}")
+        logger.error("%s: %s", error_message, e.orig)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_message
         )
@@ -139,7 +148,7 @@ async def set_user_privileges(db: AsyncSession, user: auth_schemas.DBUserCreate)
     await db.execute(text("FLUSH PRIVILEGES"))
     await db.commit()
 
-    logger.debug(f"DB user privileges set to '{user.privileges}' on '{user.db_name}'")
+    logger.debug("DB user privileges set to '%s' on '%s'", user.privileges, user.db_name)
 
 
 async def create_table(db: AsyncSession, table_info: data_schemas.TableCreate):
@@ -182,11 +191,11 @@ async def create_table(db: AsyncSession, table_info: data_schemas.TableCreate):
 
         if "1050" in str(e).lower():
             error_message = f"Table '{table_info.table_name}' already exists in database '{table_info.db_name}'"
-            logger.warning(error_message + f": {str(e.orig)}")
+            logger.warning("%s: %s", error_message, e.orig)
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error_message)
         else:
             error_message = f"Error occurred creating table '{table_info.table_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, e.orig)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_message
             )
@@ -224,14 +233,17 @@ def generate_create_table_query(db_tb_name, fields):
 
 async def get_table(db: AsyncSession, table_fetch: data_schemas.TableIdentify):
     """
-    Fetches table from database.
+    Fetches table from database as a stream of rows.
+
+    Rows are read through a server-side cursor on a dedicated connection, so
+    table is never held in memory as a whole.
 
     Parameters:
         db (AsyncSession): Async database session.
         table_fetch (Pydantic model): Table object containing db_name and table_name
 
     Returns:
-        dict: Dictionary containing table name and data.
+        AsyncIterator[bytes]: Async generator yielding one JSON encoded row per line.
 
     Raises:
         HTTPException (404): If table does not exist.
@@ -240,38 +252,81 @@ async def get_table(db: AsyncSession, table_fetch: data_schemas.TableIdentify):
 
     logger.debug("Fetching table...")
 
-    try:
-        db_name = table_fetch.db_name
-        table_name = table_fetch.table_name
-        query = text(f"SELECT * FROM `{db_name}`.`{table_name}`")
-        result = await db.execute(query)
-        table_data = [
-            row._asdict() for row in result.fetchall()
-        ]  # Fetch data, convert each row to dictionary, and store in list
+    db_name = table_fetch.db_name
+    table_name = table_fetch.table_name
 
-        message = f"Fetched table '{table_name}' " f"from database '{db_name}'"
-        logger.info(message)
+    conn = None
 
-        return {
-            table_name: data_schemas.TableData(
-                db_name=db_name, table_name=table_name, data=table_data
-            )
-        }
+    try:
+        # Dedicated connection, session is closed by get_db before response is streamed
+        conn = await db.bind.connect()
+        query = text(f"SELECT * FROM `{db_name}`.`{table_name}`")
+        result = await conn.stream(
+            query, execution_options={"yield_per": Settings.FETCH_BATCH_SIZE}
+        )
 
     except Exception as e:
-        await db.rollback()
+        if conn is not None:
+            await conn.close()
 
         if "doesn't exist" in str(e).lower():
             error_message = f"Table '{table_name}' does not exist in database '{db_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, getattr(e, "orig", e))
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
         else:
+            # Includes database being unreachable, so cached response can be served instead
             error_message = f"Error occurred fetching table '{table_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, getattr(e, "orig", e))
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_message
             )
 
+    message = f"Streaming table '{table_name}' " f"from database '{db_name}'"
+    logger.info(message)
+
+    return stream_rows(conn, result)
+
+
+async def stream_rows(conn: AsyncConnection, result: AsyncResult):
+    """
+    Stream rows of result as newline delimited JSON.
+    Rows are fetched and sent in partitions of FETCH_BATCH_SIZE rows,
+    so response is written in few large chunks instead of one per row.
+
+    Parameters:
+        conn (AsyncConnection): Connection result is read from, closed once exhausted.
+        result (AsyncResult): Streamed result of query.
+
+    Yields:
+        bytes: JSON encoded rows, each followed by newline.
+    """
+    try:
+        async for partition in result.partitions():
+            yield b"".join(
+                orjson.dumps(row._asdict(), default=json_default) + b"\n" for row in partition
+            )
+    finally:
+        await result.close()
+        await conn.close()
+
+
+def json_default(value):
+    """
+    Encode values orjson does not support natively.
+
+    DECIMAL columns are encoded as numbers, same as FastAPI's jsonable_encoder,
+    anything else (e.g. TIME columns read as timedelta) as its string form.
+
+    Parameters:
+        value (Any): Value to encode.
+
+    Returns:
+        int | float | str: JSON serialisable value.
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    return str(value)
+
 
 def handle_nan_values(row):
     """
@@ -310,63 +365,107 @@ async def insert_data(db: AsyncSession, data_insert: data_schemas.TableData):
     logger.debug("Inserting data into table...")
 
     try:
-        added_count = 0  # Counter for no. records added
-        updated_count = 0  # Counter for no. records updated
-
-        insert_query = generate_insert_query(
-            data_insert.db_name, data_insert.table_name, list(data_insert.data[0].keys())
-        )
-
-        for row in data_insert.data:  # Iterate over each row in data
-            data_dict = handle_nan_values(row)  # Handle NaN values and None
-
-            # Execute insert query with prepared data tuple
-            result = await db.execute(insert_query, data_dict)
-            # Check no. affected rows to determine if row was added or updated
-            if result.rowcount == 1:
-                added_count += 1
-            else:
-                updated_count += 1
+        added_count, updated_count = await execute_insert(db, data_insert)
 
         await db.commit()
 
-        message = (
-            f"Data insertion completed for table '{data_insert.table_name}' in database "
-            f"'{data_insert.db_name}': {added_count} records added or unchanged, {updated_count} records updated"
-        )
-        logger.info(message)
-
-        return {"message": message}  # Return no. records added and updated
+        return insert_message(data_insert, added_count, updated_count)
 
     except Exception as e:
         await db.rollback()
 
         if "1146" in str(e).lower():
             error_message = f"Table '{data_insert.table_name}' does not exist in database '{data_insert.db_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, e.orig)
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
         else:
             error_message = f"Error occurred inserting data into table '{data_insert.table_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, e.orig)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_message
             )
 
 
-def generate_insert_query(db_name: str, table_name: str, column_names: list[str]) -> str:
+async def execute_insert(db: AsyncSession, data_insert: data_schemas.TableData):
+    """
+    Execute INSERT ... ON DUPLICATE KEY UPDATE for all rows of data_insert, without commit.
+
+    Parameters:
+        db (AsyncSession): Async database session.
+        data_insert (Pydantic model): TableData object containing db_name,
+        table_name, and data
+
+    Returns:
+        tuple[int, int]: Number of records added or unchanged, number of records updated.
+    """
+
+    rows = data_insert.data
+    row_count = len(rows)
+
+    # Query is cached per table and column set, built once and reused
+    insert_query = generate_insert_query(
+        data_insert.db_name, data_insert.table_name, tuple(rows[0].keys())
+    )
+
+    affected_count = 0  # Counter for no. rows affected reported by MySQL
+    batch_size = Settings.INSERT_BATCH_SIZE
+
+    for start in range(0, row_count, batch_size):  # Send rows in batches
+        # Handle NaN values and None per batch, only one cleaned batch held in memory
+        batch = [handle_nan_values(row) for row in rows[start : start + batch_size]]
+        # Execute insert query once per batch, driver sends multi-row INSERT
+        result = await db.execute(insert_query, batch)
+        affected_count += result.rowcount
+
+    # ON DUPLICATE KEY UPDATE reports 1 per added row and 2 per updated row
+    updated_count = max(affected_count - row_count, 0)  # Counter for no. records updated
+    added_count = row_count - updated_count  # Counter for no. records added
+
+    return added_count, updated_count
+
+
+def insert_message(data_insert: data_schemas.TableData, added_count: int, updated_count: int):
+    """
+    Build and log result message of completed insert.
+
+    Parameters:
+        data_insert (Pydantic model): TableData object which was inserted.
+        added_count (int): Number of records added or unchanged.
+        updated_count (int): Number of records updated.
+
+    Returns:
+        dict: Dictionary containing message with number of
+        records added/unchanged and updated.
+    """
+
+    message = (
+        f"Data insertion completed for table '{data_insert.table_name}' in database "
+        f"'{data_insert.db_name}': {added_count} records added or unchanged, {updated_count} records updated"
+    )
+    logger.info(message)
+
+    return {"message": message}  # Return no. records added and updated
+
+
+@lru_cache(maxsize=256)
+def generate_insert_query(
+    db_name: str, table_name: str, column_names: tuple[str, ...]
+) -> TextClause:
     """
     Generate INSERT INTO SQL query with ON DUPLICATE KEY UPDATE clause.
+    Queries are memoized, repeated inserts into same table and columns reuse
+    same TextClause, which also hits SQLAlchemy's compiled statement cache.
 
     Parameters:
         db_name (str): Name of database.
         table_name (str): Name of table.
-        column_names (List[str]): List of column names.
+        column_names (Tuple[str, ...]): Tuple of column names.
 
     Returns:
-        str: complete INSERT INTO SQL query.
+        TextClause: complete INSERT INTO SQL query.
 
     Example:
-        >>> generate_insert_query("mydb", "mytable", ["col1", "col2", "col3"])
+        >>> str(generate_insert_query("mydb", "mytable", ("col1", "col2", "col3")))
         "INSERT INTO `mydb`.`mytable` (col1, col2, col3) VALUES
         (:col1, :col2, :col3) ON DUPLICATE KEY UPDATE col1 = VALUES(col1),
         col2 = VALUES(col2), col3 = VALUES(col3)"
@@ -427,12 +526,12 @@ async def delete_table(db: AsyncSession, table_delete: data_schemas.TableIdentif
 
         if "1146" in str(e).lower() or "1051" in str(e).lower():
             error_message = f"Table '{table_delete.db_name}' does not exist in database '{table_delete.db_name}'"
-            logger.warning(error_message + f": {str(e.orig)}")
+            logger.warning("%s: %s", error_message, e.orig)
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_message)
 
         else:
             error_message = f"Error occurred deleting table '{table_delete.db_name}'"
-            logger.error(error_message + f": {str(e.orig)}")
+            logger.error("%s: %s", error_message, e.orig)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_message
             )
@@ -1,16 +1,19 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+from asyncio import current_task
+
+from sqlalchemy.ext.asyncio import async_scoped_session
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.orm import sessionmaker
 
-from app.utils.logging import setup_logging
 from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Database connection
@@ -22,13 +25,30 @@ pool of connections to database specified by DATABASE_URL.
 pool_pre_ping=True option enables feature where SQLAlchemy will test
 availability of database connection before returning it from pool,
 which can help to avoid errors due to stale or disconnected connections.
+pool_recycle replaces connections older than given seconds, before MySQL
+wait_timeout closes them server side.
 """
 
 # Create asynchronous engine, echo=False to disable logging of SQL queries
-engine = create_async_engine(Settings.DATABASE_URL, echo=False, pool_pre_ping=True)
-
-# Create an asynchronous session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+engine = create_async_engine(
+    Settings.DATABASE_URL,
+    echo=False,
+    pool_size=Settings.DB_POOL_SIZE,
+    max_overflow=Settings.DB_MAX_OVERFLOW,
+    pool_recycle=Settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+
+# Refuse sync drivers, which would block event loop on every query
+if not engine.dialect.is_async:
+    raise RuntimeError(f"Database driver '{engine.dialect.driver}' is not async, use asyncmy")
+
+# Create asynchronous session factory, objects stay usable after commit
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+# Session registry scoped to current asyncio task, so all dependencies of one
+# request share single session and connection checkout
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=current_task)
 
 # Create base class for database models
 Base = declarative_base()
@@ -41,9 +61,10 @@ Base = declarative_base()
 async def get_db():
     """
     Returns database session for performing database operations.
+    Session is scoped to request task and removed once request completes.
 
     Returns:
-        SessionLocal: Asynchronous database session.
+        AsyncSession: Asynchronous database session.
 
     Raises:
         RuntimeError: If event loop is closed.
@@ -51,18 +72,16 @@ async def get_db():
 
     logger.debug("Getting database connection...")
 
-    db = SessionLocal()  # Create new database session
-    session_id = hash(db)  # Get session ID
+    db = ScopedSession()  # Get database session of current request
+    session_id = id(db)  # Get session ID
 
     try:
-        logger.info(
-            f"Database connection picked from connection pool. " f"Session ID: {session_id}"
-        )
+        logger.info("Database connection picked from connection pool. Session ID: %s", session_id)
         yield db
     finally:
         try:
-            await db.close()
-            logger.info(f"Database connection closed. Session ID: {session_id}")
+            await ScopedSession.remove()  # Close session and drop it from registry
+            logger.info("Database connection closed. Session ID: %s", session_id)
         except RuntimeError as e:
             if "Event loop is closed" not in str(e):
                 raise
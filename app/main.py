@@ -1,26 +1,36 @@
-import time
+import logging
+import os
 
 from contextlib import asynccontextmanager
 
+import uvicorn
+
 from fastapi import FastAPI
-from fastapi import Request
-from slowapi import Limiter
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 
 from app.auth import create_admin
 from app.database import db_connect
 from app.models import auth_models
 from app.routes import auth_routes
 from app.routes import data_routes
+from app.utils import cache
+from app.utils import insert_buffer
+from app.utils.limiter import limiter
 from app.utils.logging import setup_logging
+from app.utils.middleware import LoggingMiddleware
+from app.utils.middleware import PreflightMiddleware
+from app.utils.middleware import path_prefix
+from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+setup_logging()  # Configure app logger once for whole application
+
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Setting up FastAPI application
@@ -53,21 +63,21 @@ async def lifespan(app: FastAPI):
         yield
 
     finally:
-        logger.debug("Shutting down app and disposing of engine")
+        logger.debug("Shutting down app, flushing inserts, disposing of engine and closing cache")
+        await insert_buffer.buffer.close()
         await db_connect.engine.dispose()
+        await cache.close()
         logger.debug("App shut down successfully")
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)  # orjson encoder
 
 
 # ------------------------------
 # Rate limiting configuration
 # ------------------------------
 
-limiter = Limiter(key_func=get_remote_address)  # Rate limiter instance for IP address
-
-app.state.limiter = limiter  # Add rate limiter to app state
+app.state.limiter = limiter  # Add shared rate limiter to app state
 
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -87,37 +97,46 @@ app.include_router(data_routes.router)
 # Middleware for logging
 # ------------------------------
 
+app.add_middleware(LoggingMiddleware)
 
-@app.middleware("http")
-async def log_requests_and_performance(request: Request, call_next):
-    """
-    Middleware function to log incoming requests, outgoing responses, and execution time.
+# ------------------------------
+# Middleware for preflight and health checks
+# ------------------------------
 
-    Parameters:
-        request (Request): incoming request object.
-        call_next (Callable): next middleware or endpoint to call.
+# Added last so it is outermost and skips every other middleware
+app.add_middleware(
+    PreflightMiddleware, route_prefixes={path_prefix(route.path) for route in app.routes}
+)
 
-    Returns:
-        Response: outgoing response object.
-    """
-    start_time = time.perf_counter()  # perf_counter: higher precision timing
+# ------------------------------
+# Run server
+# ------------------------------
 
-    logger.debug(f"Incoming request: {request.method} {request.url}")
 
-    try:
-        response = await call_next(request)
-    except Exception as e:
-        logger.error(
-            f"Error processing request: {request.method} " f"{request.url}, Error: {str(e)}"
-        )
-        raise
-
-    end_time = time.perf_counter()
-    execution_time = end_time - start_time
-
-    logger.debug(
-        f"Outgoing response: {response.status_code}, Endpoint: "
-        f"{request.method} {request.url.path},  Execution Time: {execution_time:.4f} seconds"
+def start():
+    """
+    Starts Uvicorn server running application.
+
+    Runs Settings.WEB_CONCURRENCY worker processes on uvloop and httptools.
+    SSL is enabled when key and certificate files exist in root directory.
+    """
+    ssl_enabled = os.path.isfile(Settings.SSL_KEYFILE) and os.path.isfile(Settings.SSL_CERTFILE)
+
+    uvicorn.run(
+        "app.main:app",
+        host=Settings.API_HOST,
+        port=Settings.API_PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=Settings.WEB_CONCURRENCY,
+        backlog=Settings.SERVER_BACKLOG,
+        limit_concurrency=Settings.SERVER_LIMIT_CONCURRENCY,
+        timeout_keep_alive=Settings.SERVER_KEEP_ALIVE,
+        ssl_keyfile=Settings.SSL_KEYFILE if ssl_enabled else None,
+        ssl_certfile=Settings.SSL_CERTFILE if ssl_enabled else None,
+        ssl_keyfile_password=Settings.SSL_KEYFILE_PASSWORD if ssl_enabled else None,
     )
 
-    return response
+
+if __name__ == "__main__":
+    start()
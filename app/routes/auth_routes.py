@@ -1,11 +1,12 @@
+import asyncio
+import logging
+
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Request
 from fastapi import status
 from fastapi.security import OAuth2PasswordRequestForm
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import authenticate
@@ -15,14 +16,14 @@ from app.auth import token
 from app.crud import auth_crud
 from app.database import db_connect
 from app.schemas import auth_schemas
-from app.utils.logging import setup_logging
+from app.utils.limiter import limiter
 from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # API Router configuration
@@ -30,8 +31,6 @@ logger = setup_logging()
 
 router = APIRouter()
 
-limiter = Limiter(key_func=get_remote_address)
-
 # ------------------------------
 # API routes & endpoints for authentication
 # ------------------------------
@@ -47,8 +46,8 @@ limiter = Limiter(key_func=get_remote_address)
 async def register_api_user(
     request: Request,
     user: auth_schemas.UserCreate,
+    current_user: authorise.AdminUser,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.UserCreate = Depends(authorise.admin_user),
 ):
     """
     Endpoint allows authenticated admin user to register new API user.
@@ -93,7 +92,7 @@ async def register_api_user(
         logger.error(message)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
     else:
-        hashed_password = hashing.hash_password(user.password)
+        hashed_password = await asyncio.to_thread(hashing.hash_password, user.password)
         user.password = hashed_password  # Update password with hashed password
         message = await auth_crud.create_api_user(db, user)
 
@@ -1,8 +1,11 @@
+import logging
+
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Path
 from fastapi import Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import authorise
@@ -10,14 +13,16 @@ from app.crud import data_crud
 from app.database import db_connect
 from app.schemas import auth_schemas
 from app.schemas import data_schemas
-from app.utils.logging import setup_logging
+from app.utils import cache
+from app.utils import insert_buffer
+from app.utils.limiter import limiter
 from config import Settings
 
 # ------------------------------
 # Set up logging
 # ------------------------------
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 # ------------------------------
 # API Router configuration
@@ -25,7 +30,13 @@ logger = setup_logging()
 
 router = APIRouter()
 
-limiter = Limiter(key_func=get_remote_address)
+# Path parameters validated by FastAPI, same rules as data_schemas name fields
+db_name_path = Path(
+    pattern=data_schemas.NAME_PATTERN, min_length=1, max_length=data_schemas.NAME_MAX_LENGTH
+)
+table_name_path = Path(
+    pattern=data_schemas.NAME_PATTERN, min_length=1, max_length=data_schemas.NAME_MAX_LENGTH
+)
 
 # ------------------------------
 # API routes & endpoints for database operations
@@ -37,8 +48,8 @@ limiter = Limiter(key_func=get_remote_address)
 async def create_database(
     request: Request,
     database: data_schemas.DatabaseCreate,
+    current_user: authorise.AdminUser,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.User = Depends(authorise.admin_user),
 ):
     """
     Endpoint allows authenticated user with admin privileges to create new database.
@@ -74,7 +85,10 @@ async def create_database(
 
     logger.debug("Executing create-database endpoint...")
 
-    return await data_crud.create_database(db, database)
+    message = await data_crud.create_database(db, database)
+
+    # Dict returned as response directly, skips jsonable_encoder pass
+    return ORJSONResponse(message, status_code=201)
 
 
 @router.post("/create-db-user", status_code=201, summary="Create new database user", tags=["User"])
@@ -82,8 +96,8 @@ async def create_database(
 async def create_db_user(
     request: Request,
     user: auth_schemas.DBUserCreate,
+    current_user: authorise.AdminUser,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.User = Depends(authorise.admin_user),
 ):
     """
     Endpoint allows authenticated admin user to create new database user.
@@ -123,7 +137,9 @@ async def create_db_user(
 
     logger.debug("Executing create-db-user endpoint...")
 
-    return await data_crud.create_db_user(db, user)
+    message = await data_crud.create_db_user(db, user)
+
+    return ORJSONResponse(message, status_code=201)
 
 
 @router.post("/create-table", status_code=201, summary="Create new table", tags=["Tables"])
@@ -131,8 +147,8 @@ async def create_db_user(
 async def create_table(
     request: Request,
     tables: data_schemas.TableCreate,
+    current_user: authorise.AdminUser,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.User = Depends(authorise.admin_user),
 ):
     """
     Endpoint allows authenticated user to create new table in database.
@@ -176,7 +192,11 @@ async def create_table(
 
     logger.debug("Executing create-table endpoint...")
 
-    return await data_crud.create_table(db, tables)
+    message = await data_crud.create_table(db, tables)
+
+    await cache.invalidate_table(tables.db_name, tables.table_name)
+
+    return ORJSONResponse(message, status_code=201)
 
 
 @router.post("/insert-data", status_code=201, summary="Insert data into table", tags=["Tables"])
@@ -184,8 +204,8 @@ async def create_table(
 async def insert_data(
     request: Request,
     data_insert: data_schemas.TableData,
+    current_user: authorise.AdminUser,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.User = Depends(authorise.admin_user),
 ):
     """
     Endpoint allows authenticated admin user to insert datinto database.
@@ -235,19 +255,25 @@ async def insert_data(
 
     logger.debug("Executing insert-data endpoint...")
 
-    return await data_crud.insert_data(db, data_insert)
+    # Coalesced with concurrent inserts into same table, returns once batch is committed
+    message = await insert_buffer.buffer.submit(db, data_insert)
+
+    await cache.invalidate_table(data_insert.db_name, data_insert.table_name)
+
+    return ORJSONResponse(message, status_code=201)
 
 
 @router.get(
     "/get-table/{db_name}/{table_name}", status_code=200, summary="Get table data", tags=["Tables"]
 )
 @limiter.limit(Settings.API_RATE_LIMIT)
+@cache.cached(policy="normal", fallback=True)
 async def get_table(
     request: Request,
-    db_name: str,
-    table_name: str,
+    current_user: authorise.ActiveUser,
+    db_name: str = db_name_path,
+    table_name: str = table_name_path,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.User = Depends(authorise.active_user),
 ):
     """
     Endpoint allows authenticated admin user to retrieve datfrom table.
@@ -259,11 +285,12 @@ async def get_table(
         **current_user**: Active authenticated user obtained from *active_user* dependency.
 
     Returns:
-        dict: Dictionary containing table name and data.
+        StreamingResponse: Table rows as newline delimited JSON, one row per line.
 
     Raises:
         HTTPException (401): If token is invalid.
         HTTPException (404): If table does not exist in database.
+        HTTPException (422): If database or table name is invalid.
         HTTPException (500): If any other error occurs.
 
     Example get request:
@@ -272,28 +299,21 @@ async def get_table(
     ```
 
     Example response:
-    ```json
-    {
-        'new_table': [
-            {
-                'id': 1,
-                'name': 'Alice',
-                'age': 25
-            },
-            {
-                'id': 2,
-                'name': 'Bob',
-                'age': 30
-            }
-        ]
-    }
+    ```
+    {"id": 1, "name": "Alice", "age": 25}
+    {"id": 2, "name": "Bob", "age": 30}
+    ```
     """
 
     logger.debug("Executing get-table endpoint...")
 
-    table_fetch = data_schemas.TableIdentify(db_name=db_name, table_name=table_name)
+    # Responses are cached in Redis (when configured) by cache.cached decorator
+
+    table_fetch = data_schemas.table_identify(db_name, table_name)
 
-    return await data_crud.get_table(db, table_fetch)
+    rows = await data_crud.get_table(db, table_fetch)
+
+    return StreamingResponse(rows, media_type="application/x-ndjson")
 
 
 @router.delete(
@@ -305,10 +325,10 @@ async def get_table(
 @limiter.limit(Settings.API_RATE_LIMIT)
 async def delete_table(
     request: Request,
-    db_name: str,
-    table_name: str,
+    current_user: authorise.AdminUser,
+    db_name: str = db_name_path,
+    table_name: str = table_name_path,
     db: AsyncSession = Depends(db_connect.get_db),
-    current_user: auth_schemas.User = Depends(authorise.admin_user),
 ):
     """
     Endpoint allows authenticated admin user to delete table from database.
@@ -326,6 +346,7 @@ async def delete_table(
         HTTPException (401): If token is invalid.
         HTTPException (403): If current user is not an admin.
         HTTPException (404): If table does not exist in database.
+        HTTPException (422): If database or table name is invalid.
         HTTPException (500): If any other error occurs.
 
     Example delete request:
@@ -343,6 +364,10 @@ async def delete_table(
 
     logger.debug("Executing delete-table endpoint...")
 
-    table_delete = data_schemas.TableIdentify(db_name=db_name, table_name=table_name)
+    table_delete = data_schemas.table_identify(db_name, table_name)
+
+    message = await data_crud.delete_table(db, table_delete)
+
+    await cache.invalidate_table(db_name, table_name)
 
-    return await data_crud.delete_table(db, table_delete)
+    return ORJSONResponse(message, status_code=200)
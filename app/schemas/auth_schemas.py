@@ -1,6 +1,9 @@
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
+from app.schemas import data_schemas
+
 # ------------------------------
 # Database User Model
 # ------------------------------
@@ -15,7 +18,7 @@ class DBUserCreate(BaseModel):
     username: str = Field("testing", min_length=1, max_length=100)
     password: str = Field(..., min_length=1, max_length=100)
     privileges: str = Field("SELECT", min_length=1, max_length=100)
-    db_name: str = Field("testdb", pattern=r"^[a-z][a-z0-9_]*$", min_length=1, max_length=30)
+    db_name: str = data_schemas.db_name_field
 
 
 # ------------------------------
@@ -24,6 +27,9 @@ class DBUserCreate(BaseModel):
 
 
 class User(BaseModel):
+    # Schema built on first validation instead of at import
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     username: str
     hashed_password: str
@@ -37,5 +43,7 @@ class UserCreate(BaseModel):
 
 
 class Token(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str
     token_type: str = "bearer"
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 # ------------------------------
@@ -16,10 +18,16 @@ digits, or underscores ([a-z0-9_]*)
 3. Does not contain any uppercase letters, spaces, or special characters
 """
 
-db_name_field = Field(default="testdb", pattern=r"^[a-z][a-z0-9_]*$", min_length=1, max_length=30)
+NAME_PATTERN = r"^[a-z][a-z0-9_]*$"
+
+NAME_MAX_LENGTH = 30
+
+db_name_field = Field(
+    default="testdb", pattern=NAME_PATTERN, min_length=1, max_length=NAME_MAX_LENGTH
+)
 
 table_name_field = Field(
-    default="users", pattern=r"^[a-z][a-z0-9_]*$", min_length=1, max_length=30
+    default="users", pattern=NAME_PATTERN, min_length=1, max_length=NAME_MAX_LENGTH
 )
 
 # ------------------------------
@@ -32,6 +40,9 @@ class DatabaseCreate(BaseModel):
 
 
 class TableIdentify(BaseModel):
+    # Frozen (hashable, immutable) so validated instances can be cached and shared
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     db_name: str = db_name_field
     table_name: str = table_name_field
 
@@ -42,3 +53,27 @@ class TableCreate(TableIdentify):
 
 class TableData(TableIdentify):
     data: list[dict[str, Any]]
+
+
+# ------------------------------
+# Cached Model Construction
+# ------------------------------
+
+
+@lru_cache(maxsize=1024)
+def table_identify(db_name: str, table_name: str) -> TableIdentify:
+    """
+    Returns TableIdentify for already validated database and table name.
+
+    Used for path parameters of get-table and delete-table, which FastAPI validates
+    against NAME_PATTERN, so model is built without running validation again.
+    Instances are frozen, so repeated lookups of same table reuse one instance.
+
+    Parameters:
+        db_name (str): Validated name of database.
+        table_name (str): Validated name of table.
+
+    Returns:
+        TableIdentify: Table object.
+    """
+    return TableIdentify.model_construct(db_name=db_name, table_name=table_name)
@@ -0,0 +1,298 @@
+"""
+Script to set up Redis backed response cache for table reads.
+"""
+
+import functools
+import logging
+import time
+
+import redis.asyncio as redis
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+
+from config import Settings
+
+# ------------------------------
+# Set up logging
+# ------------------------------
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Cache configuration
+# ------------------------------
+
+"""
+Cache policies map to number of seconds cached response is served as fresh.
+Entries expire a few seconds after they go stale, or are retained for
+Settings.CACHE_STALE_TTL seconds when stale fallback is enabled, so last known
+response can be served if database is unavailable.
+"""
+
+CACHE_POLICIES = {"short": 10, "normal": 60, "long": 300}
+
+CACHE_EXPIRE_BUFFER = 5  # Seconds entry is kept after going stale
+
+# Redis client, caching disabled when REDIS_URL is not set
+redis_client = redis.from_url(Settings.REDIS_URL) if Settings.REDIS_URL else None
+
+# ------------------------------
+# Cache functions
+# ------------------------------
+
+
+def cache_key(db_name, table_name, is_admin):
+    """
+    Returns Redis key for cached table response.
+
+    Parameters:
+        db_name (str): Name of database.
+        table_name (str): Name of table.
+        is_admin (bool): Admin status of requesting user.
+
+    Returns:
+        str: Cache key.
+    """
+    return f"get-table:{db_name}:{table_name}:{int(bool(is_admin))}"
+
+
+def generation_key(db_name, table_name):
+    """
+    Returns Redis key of table's cache generation, incremented on every invalidation.
+
+    Parameters:
+        db_name (str): Name of database.
+        table_name (str): Name of table.
+
+    Returns:
+        str: Generation key.
+    """
+    return f"get-table-gen:{db_name}:{table_name}"
+
+
+async def read_generation(gen_key):
+    """
+    Reads table's cache generation, taken before response is generated.
+
+    Parameters:
+        gen_key (str): Generation key.
+
+    Returns:
+        bytes: Generation, or None if table was never invalidated or Redis is unavailable.
+    """
+    try:
+        return await redis_client.get(gen_key)
+    except (redis.RedisError, OSError) as e:
+        logger.warning("Error reading cache generation '%s': %s", gen_key, e)
+        return None
+
+
+async def read_entry(key):
+    """
+    Reads cached response entry from Redis.
+
+    Parameters:
+        key (str): Cache key.
+
+    Returns:
+        dict: Entry (body, status, media_type, generated_at, stale_at), or None if
+        entry is missing or Redis is unavailable.
+    """
+    try:
+        entry = await redis_client.hgetall(key)
+    except (redis.RedisError, OSError) as e:
+        logger.warning("Error reading cache entry '%s': %s", key, e)
+        return None
+
+    if not entry:
+        return None
+
+    return {
+        "body": entry[b"body"],
+        "status": int(entry[b"status"]),
+        "media_type": entry[b"media_type"].decode(),
+        "generated_at": float(entry[b"generated_at"]),
+        "stale_at": float(entry[b"stale_at"]),
+    }
+
+
+async def write_entry(
+    key, gen_key, generation, body, status_code, media_type, freshness, retention
+):
+    """
+    Writes response entry to Redis hash and sets its expiry.
+
+    Entry is only written if table's generation still matches one read before
+    response was generated, so response started before table was modified is
+    not cached after invalidation. Generation is watched until write executes.
+
+    Parameters:
+        key (str): Cache key.
+        gen_key (str): Generation key of table.
+        generation (bytes): Generation read before response was generated.
+        body (bytes): Serialised response body.
+        status_code (int): Response status code.
+        media_type (str): Response media type.
+        freshness (int): Seconds entry is served as fresh.
+        retention (int): Seconds entry is kept after going stale.
+    """
+    now = time.time()
+    mapping = {
+        "body": body,
+        "status": status_code,
+        "media_type": media_type,
+        "generated_at": now,
+        "stale_at": now + freshness,
+    }
+
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await pipe.watch(gen_key)
+            if await pipe.get(gen_key) != generation:
+                logger.debug("Table modified while generating '%s', not cached", key)
+                return
+            pipe.multi()
+            await pipe.hset(key, mapping=mapping).expire(key, freshness + retention).execute()
+    except redis.WatchError:
+        logger.debug("Table modified while caching '%s', not cached", key)
+    except (redis.RedisError, OSError) as e:
+        logger.warning("Error writing cache entry '%s': %s", key, e)
+
+
+async def invalidate_table(db_name, table_name):
+    """
+    Removes cached responses for table and increments its generation, called after
+    table is modified. Responses generated before increment are then not cached.
+
+    Parameters:
+        db_name (str): Name of database.
+        table_name (str): Name of table.
+    """
+    if redis_client is None:
+        return
+
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await (
+                pipe.incr(generation_key(db_name, table_name))
+                .delete(cache_key(db_name, table_name, True), cache_key(db_name, table_name, False))
+                .execute()
+            )
+    except (redis.RedisError, OSError) as e:
+        logger.warning("Error invalidating cache for table '%s': %s", table_name, e)
+
+
+async def close():
+    """
+    Closes Redis connection pool.
+    """
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+async def tee_body(body_iterator, key, gen_key, generation, response, freshness, retention):
+    """
+    Yields streamed response body and caches it once stream completes.
+
+    Body is not cached if it exceeds Settings.CACHE_MAX_BODY_BYTES.
+
+    Parameters:
+        body_iterator (AsyncIterator[bytes]): Original response body iterator.
+        key (str): Cache key.
+        gen_key (str): Generation key of table.
+        generation (bytes): Generation read before stream started.
+        response (StreamingResponse): Response being streamed.
+        freshness (int): Seconds entry is served as fresh.
+        retention (int): Seconds entry is kept after going stale.
+
+    Yields:
+        bytes: Response body chunks.
+    """
+    chunks = []
+    size = 0
+
+    async for chunk in body_iterator:
+        if chunks is not None:
+            size += len(chunk)
+            if size > Settings.CACHE_MAX_BODY_BYTES:
+                chunks = None  # Too large to cache, keep streaming only
+            else:
+                chunks.append(chunk)
+        yield chunk
+
+    if chunks is not None:
+        body = b"".join(chunks)
+        status_code, media_type = response.status_code, response.media_type
+        await write_entry(
+            key, gen_key, generation, body, status_code, media_type, freshness, retention
+        )
+
+
+def cached(policy, fallback=False):
+    """
+    Decorator caching table read endpoint responses in Redis.
+
+    Key is built from endpoint's db_name, table_name and current_user arguments.
+    Fresh entries are returned without calling endpoint. With fallback enabled,
+    stale entry is returned if endpoint fails with server error.
+
+    Parameters:
+        policy (str): Cache policy name, one of CACHE_POLICIES.
+        fallback (bool): Serve stale entry if endpoint fails. Defaults to False.
+
+    Returns:
+        Callable: Decorator for async endpoint.
+    """
+    freshness = CACHE_POLICIES[policy]
+    retention = Settings.CACHE_STALE_TTL if fallback else CACHE_EXPIRE_BUFFER
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if redis_client is None:
+                return await func(*args, **kwargs)
+
+            is_admin = kwargs["current_user"].is_admin
+            key = cache_key(kwargs["db_name"], kwargs["table_name"], is_admin)
+            entry = await read_entry(key)
+
+            if entry and time.time() < entry["stale_at"]:
+                logger.debug("Cache hit for '%s'", key)
+                return Response(entry["body"], entry["status"], media_type=entry["media_type"])
+
+            # Read before endpoint queries table, so later invalidation is detected
+            gen_key = generation_key(kwargs["db_name"], kwargs["table_name"])
+            generation = await read_generation(gen_key)
+
+            try:
+                response = await func(*args, **kwargs)
+            except HTTPException as e:
+                if fallback and entry and e.status_code >= 500:
+                    logger.warning("Serving stale cache entry for '%s' after error", key)
+                    return Response(entry["body"], entry["status"], media_type=entry["media_type"])
+                raise
+
+            if isinstance(response, StreamingResponse):
+                response.body_iterator = tee_body(
+                    response.body_iterator, key, gen_key, generation, response, freshness, retention
+                )
+            else:
+                status_code, media_type = response.status_code, response.media_type
+                await write_entry(
+                    key,
+                    gen_key,
+                    generation,
+                    response.body,
+                    status_code,
+                    media_type,
+                    freshness,
+                    retention,
+                )
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,248 @@
+"""
+Script to set up buffer coalescing concurrent inserts into same table.
+"""
+
+import asyncio
+import logging
+
+from app.crud import data_crud
+from app.database import db_connect
+from config import Settings
+
+# ------------------------------
+# Set up logging
+# ------------------------------
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Insert buffer
+# ------------------------------
+
+
+class InsertBatch:
+    """
+    Pending inserts into one table, flushed together.
+
+    Parameters:
+        bind (AsyncEngine): Engine of first submitter's session, used for flush.
+    """
+
+    def __init__(self, bind):
+        self.bind = bind
+        self.entries = []  # (TableData, Future) per submitted request
+        self.row_count = 0
+
+
+class InsertBuffer:
+    """
+    Coalesces concurrent inserts into same table into one transaction.
+
+    Insert into table with no write in flight is flushed straight away, so lone
+    requests are not delayed. Submissions for same database, table and columns
+    arriving while write is in flight are collected and flushed together as soon as
+    that write finishes, or once max_rows rows are pending. Batch is written in one
+    session with one commit, each submission executed separately so each submitter
+    receives counts of its own rows. If batch fails, its submissions are retried one
+    by one so each submitter gets error for its own rows.
+
+    Parameters:
+        max_rows (int): Number of pending rows which triggers immediate flush.
+        enabled (bool): False writes every submission directly, without buffering.
+    """
+
+    def __init__(self, max_rows, enabled=True):
+        self.max_rows = max_rows
+        self.enabled = enabled
+        self.batches = {}  # (db_name, table_name, columns) -> pending InsertBatch
+        self.in_flight = {}  # (db_name, table_name, columns) -> number of running flushes
+        self.tasks = set()  # Running flush tasks, referenced until done
+
+    async def submit(self, db, data_insert):
+        """
+        Adds data to pending batch for its table and waits until batch is written.
+
+        Parameters:
+            db (AsyncSession): Async database session of request.
+            data_insert (Pydantic model): TableData object containing db_name,
+            table_name, and data
+
+        Returns:
+            dict: Dictionary containing message with number of
+            records added/unchanged and updated.
+
+        Raises:
+            HTTPException (404): If table does not exist.
+            HTTPException (500): If error inserting data.
+        """
+
+        if not self.enabled or not data_insert.data:
+            return await data_crud.insert_data(db, data_insert)
+
+        key = (data_insert.db_name, data_insert.table_name, tuple(data_insert.data[0].keys()))
+
+        batch = self.batches.get(key)
+        if batch is None:
+            batch = self.batches[key] = InsertBatch(db.bind)
+            if key not in self.in_flight:
+                self.run(self.flush(key, batch))  # Table idle, write without waiting
+            # Otherwise flushed by running write of same key once it finishes
+
+        future = asyncio.get_running_loop().create_future()
+        batch.entries.append((data_insert, future))
+        batch.row_count += len(data_insert.data)
+
+        if batch.row_count >= self.max_rows:
+            self.run(self.flush(key, batch))
+
+        logger.debug(
+            "Buffered %d rows for table '%s'", len(data_insert.data), data_insert.table_name
+        )
+
+        return await future
+
+    def run(self, coro):
+        """
+        Runs coroutine as background task, keeping reference until it completes.
+
+        Parameters:
+            coro (Coroutine): Coroutine to run.
+        """
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def flush(self, key, batch):
+        """
+        Writes batch to database and resolves its submitters, then starts flush
+        of batch collected for same key meanwhile.
+
+        Parameters:
+            key (tuple): Batch key.
+            batch (InsertBatch): Batch to flush.
+        """
+
+        if self.batches.get(key) is not batch:
+            return  # Already flushed
+
+        del self.batches[key]
+        self.in_flight[key] = self.in_flight.get(key, 0) + 1
+
+        try:
+            await self.write(batch)
+        finally:
+            self.in_flight[key] -= 1
+            if not self.in_flight[key]:
+                del self.in_flight[key]
+                pending = self.batches.get(key)
+                if pending is not None:
+                    self.run(self.flush(key, pending))
+
+    async def write(self, batch):
+        """
+        Inserts all submissions of batch and resolves their futures.
+
+        Parameters:
+            batch (InsertBatch): Batch to write.
+        """
+
+        table_name = batch.entries[0][0].table_name
+
+        logger.debug(
+            "Flushing %d rows from %d requests into table '%s'",
+            batch.row_count,
+            len(batch.entries),
+            table_name,
+        )
+
+        if len(batch.entries) == 1:
+            data_insert, future = batch.entries[0]
+            try:
+                resolve(future, result=await self.insert(batch.bind, data_insert))
+            except Exception as e:
+                resolve(future, exception=e)
+            return
+
+        try:
+            results = await self.insert_many(batch.bind, [entry[0] for entry in batch.entries])
+        except Exception:
+            logger.warning(
+                "Batched insert into table '%s' failed, retrying per request", table_name
+            )
+            for data_insert, future in batch.entries:
+                try:
+                    resolve(future, result=await self.insert(batch.bind, data_insert))
+                except Exception as e:
+                    resolve(future, exception=e)
+            return
+
+        for (_, future), result in zip(batch.entries, results):
+            resolve(future, result=result)
+
+    async def insert(self, bind, data_insert):
+        """
+        Inserts data using new session on given engine.
+
+        Parameters:
+            bind (AsyncEngine): Engine to insert with.
+            data_insert (Pydantic model): TableData object to insert.
+
+        Returns:
+            dict: Result of data_crud.insert_data.
+        """
+        async with db_connect.SessionLocal(bind=bind) as db:
+            return await data_crud.insert_data(db, data_insert)
+
+    async def insert_many(self, bind, data_inserts):
+        """
+        Inserts several submissions in one transaction using new session on given engine.
+
+        Parameters:
+            bind (AsyncEngine): Engine to insert with.
+            data_inserts (List[TableData]): TableData objects to insert.
+
+        Returns:
+            List[dict]: Result message per submission, counts cover its own rows only.
+
+        Raises:
+            Exception: If any insert fails, whole transaction is rolled back.
+        """
+        async with db_connect.SessionLocal(bind=bind) as db:
+            counts = [await data_crud.execute_insert(db, item) for item in data_inserts]
+            await db.commit()
+
+        return [
+            data_crud.insert_message(item, added_count, updated_count)
+            for item, (added_count, updated_count) in zip(data_inserts, counts)
+        ]
+
+    async def close(self):
+        """
+        Flushes all pending batches and waits for running writes, called on application shutdown.
+        """
+        while self.batches or self.tasks:
+            await asyncio.gather(
+                *(self.flush(key, batch) for key, batch in list(self.batches.items())),
+                *list(self.tasks),
+            )
+
+
+def resolve(future, result=None, exception=None):
+    """
+    Sets result or exception of future unless submitter already gave up on it.
+
+    Parameters:
+        future (Future): Future awaited by submitter.
+        result (Any): Result to set.
+        exception (Exception): Exception to set instead of result.
+    """
+    if future.done():
+        return
+
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+buffer = InsertBuffer(Settings.INSERT_BUFFER_MAX_ROWS, Settings.INSERT_BUFFER_ENABLED)
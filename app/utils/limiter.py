@@ -0,0 +1,51 @@
+"""
+Script to set up rate limiter shared by all routes.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from config import Settings
+
+# ------------------------------
+# Rate limit key
+# ------------------------------
+
+
+def real_ip(request):
+    """
+    Returns client IP address used as rate limit key.
+
+    Behind reverse proxy every request comes from proxy address, so when
+    TRUST_PROXY_HEADERS is set, client address is read from X-Forwarded-For
+    or X-Real-IP header instead. Each proxy appends address it received request
+    from, so entries left of those added by TRUSTED_PROXY_HOPS proxies are
+    client-supplied and ignored. Only enable it when proxy sets these headers,
+    otherwise clients can choose their own key.
+
+    Parameters:
+        request (Request): Incoming request.
+
+    Returns:
+        str: Client IP address.
+    """
+
+    if Settings.TRUST_PROXY_HEADERS:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            hops = forwarded.split(",")
+            depth = min(max(Settings.TRUSTED_PROXY_HOPS, 1), len(hops))
+            return hops[-depth].strip()
+        forwarded = request.headers.get("x-real-ip")
+        if forwarded:
+            return forwarded.strip()
+
+    return get_remote_address(request)
+
+
+# ------------------------------
+# Rate limiter
+# ------------------------------
+
+# Counters kept in Redis when configured, so limit is shared by all workers
+limiter = Limiter(key_func=real_ip, storage_uri=Settings.RATE_LIMIT_STORAGE_URI)
@@ -2,34 +2,43 @@
 Script to set up logging configuration.
 """
 
+import atexit
 import logging
 import os
+import queue
 
+from functools import lru_cache
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from logging.handlers import RotatingFileHandler
 
 from config import Settings
 
 
+@lru_cache(maxsize=1)
 def setup_logging():
     """
     Set up logging configuration.
 
-    This function creates logger, sets logging level,
-    and adds console and file handlers to logger.
+    This function creates logger for app package, sets logging level,
+    and adds queue handler to logger. Console and file handlers run in background
+    thread of queue listener, so logging call never blocks event loop on I/O.
+    Module loggers created with logging.getLogger(__name__) propagate to it. Result is memoized, so
+    handlers are only built on first call and later calls return same logger.
 
     Returns:
         logger (logging.Logger): configured logger object.
     """
 
-    # Create logger
-    logger = logging.getLogger(__name__)
-    # Prevent logs from propagating to parent logger
-    logger.propagate = False
+    # Create logger for app package
+    logger = logging.getLogger("app")
+
+    # Logger already configured, avoid stacking duplicate handlers
+    if logger.handlers:
+        return logger
 
-    # Remove existing handlers, if any.[:] is used to create copy of list of handlers
-    for handler in logger.handlers[:]:
-        handler.close()
-        logger.removeHandler(handler)
+    # Prevent logs from propagating to root logger
+    logger.propagate = False
 
     # Set logging level
     logging_level = getattr(logging, Settings.LOGGING_LEVEL.upper(), logging.INFO)
@@ -57,8 +66,13 @@ def setup_logging():
     file_handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=10)
     file_handler.setFormatter(formatter)  # Set formatter
 
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Hand records to background listener thread which writes them to handlers
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on exit
+
+    # Add queue handler to logger
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
@@ -0,0 +1,121 @@
+"""
+Script to define ASGI middleware.
+"""
+
+import logging
+import time
+
+# ------------------------------
+# Set up logging
+# ------------------------------
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------
+# Middleware for logging
+# ------------------------------
+
+
+class LoggingMiddleware:
+    """
+    ASGI middleware to log incoming requests, outgoing responses, and execution time.
+
+    Reads method, path and query string straight from ASGI scope, so no Request
+    or URL object is built per request.
+
+    Parameters:
+        app (ASGIApp): next ASGI application in middleware stack.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()  # perf_counter: higher precision timing
+
+        method = scope["method"]
+        path = (scope.get("raw_path") or scope["path"].encode()).decode("latin-1")
+        query = scope["query_string"].decode("latin-1")
+        target = f"{path}?{query}" if query else path  # No trailing '?' without query
+
+        logger.debug("Incoming request: %s %s", method, target)
+
+        status_code = 500  # Reported if app fails before starting response
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as e:
+            logger.error("Error processing request: %s %s, Error: %s", method, target, e)
+            raise
+
+        execution_time = time.perf_counter() - start_time
+
+        logger.debug(
+            "Outgoing response: %d, Endpoint: %s %s,  Execution Time: %.4f seconds",
+            status_code,
+            method,
+            path,
+            execution_time,
+        )
+
+
+# ------------------------------
+# Middleware for preflight and health checks
+# ------------------------------
+
+
+class PreflightMiddleware:
+    """
+    ASGI middleware answering OPTIONS and HEAD requests for non-API paths.
+
+    Such requests (CORS preflights, load balancer health checks) get an empty 204
+    response straight away, without running logging, rate limiting or auth.
+
+    Parameters:
+        app (ASGIApp): next ASGI application in middleware stack.
+        route_prefixes (Iterable[str]): first path segments of application routes,
+        e.g. '/get-table'. Requests to these paths are passed through.
+    """
+
+    def __init__(self, app, route_prefixes):
+        self.app = app
+        self.route_prefixes = frozenset(route_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["method"] in ("OPTIONS", "HEAD")
+            and path_prefix(scope["path"]) not in self.route_prefixes
+        ):
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await self.app(scope, receive, send)
+
+
+def path_prefix(path):
+    """
+    Returns first segment of URL path.
+
+    Parameters:
+        path (str): URL path.
+
+    Returns:
+        str: First path segment including leading slash.
+
+    Example:
+        >>> path_prefix("/get-table/testdb/users")
+        '/get-table'
+    """
+    return "/" + path.split("/", 2)[1]
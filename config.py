@@ -1,6 +1,7 @@
 import os
 
 from dotenv import load_dotenv
+from sqlalchemy.engine import URL
 
 # Load environment variables from .env file
 load_dotenv()
@@ -22,17 +23,20 @@ class Settings:
     MYSQL_USER = os.getenv("MYSQL_USER")
     MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
     MYSQL_DATABASE = os.getenv("MYSQL_DATABASE")
-    DATABASE_URL = (
-        f"mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}"
-        f"@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+    # URL objects escape special characters in password and skip DSN parsing in engine
+    DATABASE_URL = URL.create(
+        "mysql+asyncmy",
+        username=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        host=MYSQL_HOST,
+        port=int(MYSQL_PORT),
+        database=MYSQL_DATABASE,
     )
 
     # MySQL database testing connection
     MYSQL_TEST_USER = os.getenv("MYSQL_TEST_USER")
-    TEST_DATABASE_URL = (
-        f"mysql+aiomysql://{MYSQL_TEST_USER}:{MYSQL_PASSWORD}"
-        f"@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
-    )
+    TEST_DATABASE_URL = DATABASE_URL.set(username=MYSQL_TEST_USER)
+    TEST_DB_POOL_SIZE = 25  # Fixed size test pool, opened once at session start
 
     # Testing placeholders
     TEST_USER = "testing"
@@ -41,17 +45,56 @@ class Settings:
     TEST_DB_NAME_2 = "testdb2"
     TEST_TABLE_NAME = "users"
 
+    # Redis response cache, disabled when REDIS_URL is not set
+    REDIS_URL = os.getenv("REDIS_URL")
+    CACHE_STALE_TTL = 3600  # Seconds stale responses are kept for fallback
+    CACHE_MAX_BODY_BYTES = 1048576  # Larger responses are not cached
+
+    # Connection pool of database engine
+    DB_POOL_SIZE = 20
+    DB_MAX_OVERFLOW = 10
+    DB_POOL_RECYCLE = 3600  # Seconds before connection is replaced
+
+    # Number of rows sent per INSERT statement
+    INSERT_BATCH_SIZE = 1000
+
+    # Number of rows fetched and streamed per chunk by get-table
+    FETCH_BATCH_SIZE = 1000
+
+    # Coalescing of inserts into same table arriving while write to it is in flight
+    INSERT_BUFFER_MAX_ROWS = int(os.getenv("INSERT_BUFFER_MAX_ROWS", "100000"))
+    INSERT_BUFFER_ENABLED = os.getenv("INSERT_BUFFER_ENABLED", "true").lower() == "true"
+
     # API admin user and password
     API_ADM_USER = os.getenv("API_ADMIN_USER")
     API_ADM_PASSWORD = os.getenv("API_ADMIN_PASSWORD")
 
     # Rate limiting configuration
     API_RATE_LIMIT = "30/minute"
+    RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI") or REDIS_URL or "memory://"
+    TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+    TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "1"))  # Proxies in front of API
 
     # Token configuration
     TOKEN_EXPIRE_MINUTES = 60
     TOKEN_SECRET_KEY = os.getenv("SECRET_KEY")
     TOKEN_ALGORITHM = os.getenv("ALGORITHM")
 
+    # In-process cache of authenticated API users
+    USER_CACHE_SIZE = 1024  # Per shard
+    USER_CACHE_TTL = 60  # Seconds before user is read from database again
+
+    # Server configuration
+    API_HOST = os.getenv("API_HOST", "0.0.0.0")
+    API_PORT = int(os.getenv("API_PORT", "8000"))
+    # Workers, each with own pool of up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections, so
+    # keep workers * 30 below MySQL max_connections (151 by default) when raising it
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY") or 1)
+    SERVER_BACKLOG = 4096
+    SERVER_LIMIT_CONCURRENCY = 1000
+    SERVER_KEEP_ALIVE = 30
+
     # SSL configuration
+    SSL_KEYFILE = os.path.join(ROOT_DIRECTORY, "key.pem")
+    SSL_CERTFILE = os.path.join(ROOT_DIRECTORY, "cert.pem")
     SSL_KEYFILE_PASSWORD = os.getenv("SSL_KEYFILE_PASSWORD")
@@ -2,50 +2,57 @@ import pytest
 
 from config import Settings
 
+# Payloads built once at import, fixtures return shared dicts, do not mutate in tests
+CREATE_TABLE_PAYLOAD = {
+    'db_name': Settings.TEST_DB_NAME,
+    'table_name': Settings.TEST_TABLE_NAME,
+    'table_schema': {
+        'id': 'INT PRIMARY KEY',
+        'name': 'VARCHAR(50)',
+        'age': 'INT'
+    }
+}
+
+INSERT_DATA_PAYLOAD = {
+    'db_name': Settings.TEST_DB_NAME,
+    'table_name': Settings.TEST_TABLE_NAME,
+    'data': [
+        {
+            'id': 1,
+            'name': 'John Doe',
+            'age': 25
+        },
+        {
+            'id': 2,
+            'name': 'Jane Smith',
+            'age': 30
+        }
+    ]
+}
+
+INSERT_INVALID_DATA_PAYLOAD = {
+    'db_name': Settings.TEST_DB_NAME,
+    'table_name': Settings.TEST_TABLE_NAME,
+    'data': [
+        {
+            'id': 'invalid_id',
+            'name': 'John Doe',
+            'age': 25
+        }
+    ]
+}
+
 
 @pytest.fixture
 def create_table_payload():
-    return {
-        'db_name': Settings.TEST_DB_NAME,
-        'table_name': Settings.TEST_TABLE_NAME,
-        'table_schema': {
-            'id': 'INT PRIMARY KEY',
-            'name': 'VARCHAR(50)',
-            'age': 'INT'
-        }
-    }
+    return CREATE_TABLE_PAYLOAD
 
 
 @pytest.fixture
 def insert_data_payload():
-    return {
-        'db_name': Settings.TEST_DB_NAME,
-        'table_name': Settings.TEST_TABLE_NAME,
-        'data': [
-            {
-                'id': 1,
-                'name': 'John Doe',
-                'age': 25
-            },
-            {
-                'id': 2,
-                'name': 'Jane Smith',
-                'age': 30
-            }
-        ]
-    }
+    return INSERT_DATA_PAYLOAD
 
 
 @pytest.fixture
 def insert_invalid_data_payload():
-    return {
-        'db_name': Settings.TEST_DB_NAME,
-        'table_name': Settings.TEST_TABLE_NAME,
-        'data': [
-            {
-                'id': 'invalid_id',
-                'name': 'John Doe',
-                'age': 25
-            }
-        ]
-    }
\ No newline at end of file
+    return INSERT_INVALID_DATA_PAYLOAD
@@ -1,9 +1,11 @@
 import pytest
 from httpx import AsyncClient, ASGITransport
 import asyncio
+import logging
+import uvloop
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from config import Settings
 from app.utils.logging import setup_logging
@@ -23,13 +25,12 @@ logger = setup_logging()
 
 # Create an asynchronous test engine
 test_engine = create_async_engine(
-    Settings.TEST_DATABASE_URL, echo=False, pool_pre_ping=True
+    Settings.TEST_DATABASE_URL, echo=False, pool_pre_ping=False
 )
 
 # Create an asynchronous test session
-TestingSessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=test_engine, class_=AsyncSession,
-    expire_on_commit=False
+TestingSessionLocal = async_sessionmaker(
+    bind=test_engine, autoflush=False, expire_on_commit=False
 )
 
 
@@ -56,9 +57,11 @@ async def async_db(async_db_engine):
 
         await session.rollback()
 
+        # MySQL has no TRUNCATE ... CASCADE and asyncmy doesn't enable multi-statements,
+        # so truncate each table and commit once at end
         for table in reversed(db_connect.Base.metadata.sorted_tables):
-            await session.execute(f'TRUNCATE {table.name} CASCADE;')
-            await session.commit()
+            await session.execute(text(f'TRUNCATE TABLE `{table.name}`'))
+        await session.commit()
 
 
 @pytest.fixture(scope='session')
@@ -69,8 +72,7 @@ async def async_client() -> AsyncClient:
 # let test session to know it is running inside event loop
 @pytest.fixture(scope='session')
 def event_loop():
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
+    loop = uvloop.new_event_loop()  # libuv based loop, same as app server runs on
     yield loop
     loop.close()
 
@@ -92,9 +94,9 @@ async def test_register_api_user(async_client):
     logger.info(f'!!!!!!!! Access Token received: {headers}')
 
     logger.info(f'Test Engine: {test_engine.url}')
-    pending = asyncio.all_tasks()
-    for task in pending:
-        logger.info(f'Pending task at test end: {task}')
+    if logger.isEnabledFor(logging.INFO):
+        for task in asyncio.all_tasks():
+            logger.info('Pending task at test end: %s', task)
 
     logger.info('!!!!!!!! Starting test_register_api_user')
 
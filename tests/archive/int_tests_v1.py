@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 import asyncio
+import logging
 
 # Custom imports
 from config import Settings
@@ -23,13 +24,6 @@ TEST_TABLE_NAME = 'users'
 
 logger = setup_logging()
 
-# ------------------------------
-# Set test client
-# ------------------------------
-
-# client = TestClient(app)
-
-
 # ------------------------------
 # Test cases
 # ------------------------------
@@ -56,9 +50,9 @@ async def test_get_token():
     # Close AsyncClient
     await client.aclose()
 
-    pending = asyncio.all_tasks()
-    for task in pending:
-        logger.info(f'Pending task at test end: {task}')
+    if logger.isEnabledFor(logging.INFO):
+        for task in asyncio.all_tasks():
+            logger.info('Pending task at test end: %s', task)
 
 
 @pytest.mark.asyncio(scope="session")
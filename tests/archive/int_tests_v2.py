@@ -1,9 +1,9 @@
 import pytest
 from httpx import AsyncClient, ASGITransport
 import asyncio
+import logging
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 # Custom imports
 from config import Settings
@@ -24,12 +24,12 @@ logger = setup_logging()
 
 # Create an asynchronous test engine
 test_engine = create_async_engine(
-    Settings.TEST_DATABASE_URL, echo=False, pool_pre_ping=True
+    Settings.TEST_DATABASE_URL, echo=False, pool_pre_ping=False
 )
 
 # Create an asynchronous test session
-TestingSessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=test_engine, class_=AsyncSession
+TestingSessionLocal = async_sessionmaker(
+    bind=test_engine, autoflush=False, expire_on_commit=False
 )
 
 # ------------------------------
@@ -40,22 +40,28 @@ TestingSessionLocal = sessionmaker(
 # Dependency to get database connection
 async def override_get_db():
     db = TestingSessionLocal()
-    session_id = hash(db)
+    session_id = id(db)
 
     try:
-        logger.info(f"Database connection picked from connection pool. "
-                    f"Session ID: {session_id}")
+        logger.info("Database connection picked from connection pool. Session ID: %s", session_id)
         yield db
     finally:
         try:
             await db.close()
-            logger.info(f"Database connection closed. Session ID: {session_id}")
+            logger.info("Database connection closed. Session ID: %s", session_id)
         except RuntimeError as e:
             if "Event loop is closed" not in str(e):
                 raise
 
 app.dependency_overrides[db_connect.get_db] = override_get_db
 
+# ------------------------------
+# Set up transport
+# ------------------------------
+
+# Built once, every test client wraps same transport instead of re-wrapping app
+TRANSPORT = ASGITransport(app=app)
+
 # ------------------------------
 # Test cases
 # ------------------------------
@@ -63,7 +69,7 @@ app.dependency_overrides[db_connect.get_db] = override_get_db
 
 @pytest.mark.asyncio(scope="session")
 async def test_get_token():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+    async with AsyncClient(transport=TRANSPORT, base_url="http://test") as client:
         logger.info('!!!!!!!! Starting test_get_token')
 
         payload = {
@@ -81,14 +87,14 @@ async def test_get_token():
 
     logger.info(f'Test Engine: {test_engine.url}')
 
-    pending = asyncio.all_tasks()
-    for task in pending:
-        logger.info(f'Pending task at test end: {task}')
+    if logger.isEnabledFor(logging.INFO):
+        for task in asyncio.all_tasks():
+            logger.info('Pending task at test end: %s', task)
 
 
 @pytest.mark.asyncio(scope="session")
 async def test_register_api_user():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+    async with AsyncClient(transport=TRANSPORT, base_url="http://test") as client:
         logger.info('!!!!!!!! Starting test_register_api_user')
 
         payload = {
@@ -120,7 +126,7 @@ async def test_register_api_user():
 
 @pytest.mark.asyncio(scope="session")
 async def test_create_db():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+    async with AsyncClient(transport=TRANSPORT, base_url="http://test") as client:
         logger.info('!!!!!!!! Starting test_create_db')
 
         payload = {
@@ -147,7 +153,7 @@ async def test_create_db():
 
 @pytest.mark.asyncio(scope="session")
 async def test_create_db_user():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+    async with AsyncClient(transport=TRANSPORT, base_url="http://test") as client:
         logger.info('!!!!!!!! Starting test_create_db_user')
 
         payload = {
@@ -179,7 +185,7 @@ async def test_create_db_user():
 
 @pytest.mark.asyncio(scope="session")
 async def test_create_table():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+    async with AsyncClient(transport=TRANSPORT, base_url="http://test") as client:
         logger.info('!!!!!!!! Starting test_create_table')
 
         payload = {
@@ -213,7 +219,7 @@ async def test_create_table():
 
 @pytest.mark.asyncio(scope="session")
 async def test_insert_data():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+    async with AsyncClient(transport=TRANSPORT, base_url="http://test") as client:
         logger.info('!!!!!!!! Starting test_insert_data')
 
         payload = {
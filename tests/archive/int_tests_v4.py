@@ -1,6 +1,8 @@
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 import asyncio
+import logging
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -61,27 +63,26 @@ app.dependency_overrides[db_connect.get_db] = override_get_db
 # ------------------------------
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope='session')
 async def client():
     async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
         yield client
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope='session')
 async def access_token(client):
-    async for client in client:
-        logger.info('!!!!!!!! Starting access_token')
-        payload = {
-            'username': Settings.API_ADM_USER,
-            'password': Settings.API_ADM_PASSWORD
-        }
-        response = await client.post(
-            '/get-token',
-            data=payload
-        )
-        headers = {'Authorization': f'Bearer {response.json()['access_token']}'}
-        logger.info(f'!!!!!!!! Access Token received: {headers}')
-        return headers
+    logger.info('!!!!!!!! Starting access_token')
+    payload = {
+        'username': Settings.API_ADM_USER,
+        'password': Settings.API_ADM_PASSWORD
+    }
+    response = await client.post(
+        '/get-token',
+        data=payload
+    )
+    headers = {'Authorization': f'Bearer {response.json()['access_token']}'}
+    logger.info(f'!!!!!!!! Access Token received: {headers}')
+    return headers
 
 
 # ------------------------------
@@ -91,50 +92,48 @@ async def access_token(client):
 
 @pytest.mark.asyncio(scope='session')
 async def test_get_token(client):
-    async for client in client:
-        logger.info('!!!!!!!! Starting test_get_token')
-
-        payload = {
-            'username': Settings.API_ADM_USER,
-            'password': Settings.API_ADM_PASSWORD
-        }
-        response = await client.post(
-            '/get-token',
-            data=payload
-        )
-        assert response.status_code == 200
-        headers = {'Authorization': f'Bearer {response.json()['access_token']}'}
-        logger.info(f'!!!!!!!! Access Token received: {headers}')
-
-        logger.info(f'Test Engine: {test_engine.url}')
-        pending = asyncio.all_tasks()
-        for task in pending:
-            logger.info(f'Pending task at test end: {task}')
+    logger.info('!!!!!!!! Starting test_get_token')
+
+    payload = {
+        'username': Settings.API_ADM_USER,
+        'password': Settings.API_ADM_PASSWORD
+    }
+    response = await client.post(
+        '/get-token',
+        data=payload
+    )
+    assert response.status_code == 200
+    headers = {'Authorization': f'Bearer {response.json()['access_token']}'}
+    logger.info(f'!!!!!!!! Access Token received: {headers}')
+
+    logger.info(f'Test Engine: {test_engine.url}')
+    if logger.isEnabledFor(logging.INFO):
+        for task in asyncio.all_tasks():
+            logger.info('Pending task at test end: %s', task)
 
 
 @pytest.mark.asyncio(scope='session')
 async def test_register_api_user(client, access_token):
 
-    headers = await access_token
-
-    async for client in client:
-        logger.info('!!!!!!!! Starting test_register_api_user')
-
-        # Prepare test data
-        user_dat= {
-            'username': Settings.TEST_USER,
-            'password': Settings.TEST_PASSWORD,
-            'is_admin': True
-        }
-        # Send POST request to registration endpoint
-        response = await client.post(
-            '/register-api-user',
-            json=user_data,
-            headers=headers
-        )
-        assert response.status_code == 201
-        assert 'created successfully' in response.json()['message']
-        logger.info(f'!!!!!!!! Response register-api-user: {response.json()}')
+    headers = access_token
+
+    logger.info('!!!!!!!! Starting test_register_api_user')
+
+    # Prepare test data
+    user_data = {
+        'username': Settings.TEST_USER,
+        'password': Settings.TEST_PASSWORD,
+        'is_admin': True
+    }
+    # Send POST request to registration endpoint
+    response = await client.post(
+        '/register-api-user',
+        json=user_data,
+        headers=headers
+    )
+    assert response.status_code == 201
+    assert 'created successfully' in response.json()['message']
+    logger.info(f'!!!!!!!! Response register-api-user: {response.json()}')
 
 
 # @pytest.mark.asyncio(scope='session')
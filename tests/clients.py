@@ -0,0 +1,27 @@
+import types
+
+import httpx
+import orjson
+
+# ------------------------------
+# Headers
+# ------------------------------
+
+# Sent with request bodies encoded up front and passed as content=
+JSON_HEADERS = types.MappingProxyType({"Content-Type": "application/json"})
+
+# ------------------------------
+# Client
+# ------------------------------
+
+
+class ORJSONClient(httpx.AsyncClient):
+    """
+    AsyncClient encoding json= request bodies with orjson instead of stdlib json.
+    """
+
+    def build_request(self, method, url, *, json=None, content=None, headers=None, **kwargs):
+        if json is not None:
+            content = orjson.dumps(json)
+            headers = {**(headers or {}), **JSON_HEADERS}
+        return super().build_request(method, url, content=content, headers=headers, **kwargs)
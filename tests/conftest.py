@@ -1,15 +1,27 @@
+import asyncio
+import logging
+import types
+import urllib.parse
+
 import pytest
+import pytest_asyncio
+import uvloop
 
 from httpx import ASGITransport
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from passlib.hash import bcrypt
+from sqlalchemy import delete
+from sqlalchemy import text
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.database import db_connect
 from app.main import app
+from app.models import auth_models
 from app.utils.logging import setup_logging
 from config import Settings
+from tests.clients import ORJSONClient
 
 # ------------------------------
 # Set up logging
@@ -21,13 +33,20 @@ logger = setup_logging()
 # Set up test database connection
 # ------------------------------
 
-# Create an asynchronous test engine
-test_engine = create_async_engine(Settings.TEST_DATABASE_URL, echo=False, pool_pre_ping=True)
+# Create an asynchronous test engine, pool warmed up and disposed by warm_pool fixture,
+# no pre-ping as test connections are short lived and local
+test_engine = create_async_engine(
+    Settings.TEST_DATABASE_URL,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=Settings.TEST_DB_POOL_SIZE,
+    max_overflow=0,
+    pool_recycle=1800,
+    pool_pre_ping=False,
+)
 
 # Create an asynchronous test session
-TestingSessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=test_engine, class_=AsyncSession
-)
+TestingSessionLocal = async_sessionmaker(bind=test_engine, autoflush=False, expire_on_commit=False)
 
 # ------------------------------
 # Override dependency
@@ -37,36 +56,76 @@ TestingSessionLocal = sessionmaker(
 # Dependency to get database connection
 async def override_get_db():
     db = TestingSessionLocal()
-    session_id = hash(db)
     try:
-        logger.info(
-            f"Database connection picked from connection pool. " f"Session ID: {session_id}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Database connection picked from connection pool. Session ID: %d", id(db))
         yield db
     finally:
-        try:
-            await db.close()
-            logger.info(f"Database connection closed. Session ID: {session_id}")
-        except RuntimeError as e:
-            if "Event loop is closed" not in str(e):
-                raise
+        await db.close()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Database connection closed. Session ID: %d", id(db))
 
 
 app.dependency_overrides[db_connect.get_db] = override_get_db
 
 
 # ------------------------------
-# Payloads
+# Event loop
 # ------------------------------
 
 
-@pytest.fixture
-def create_table_payload(request):
-    payload = {
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # Run session event loop on uvloop, same loop implementation as app server
+    return uvloop.EventLoopPolicy()
+
+
+def pytest_collection_modifyitems(items):
+    # Run all async tests in session event loop, shared with session-scoped async fixtures
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+# ------------------------------
+# Payloads
+# ------------------------------
+
+# Read-only payload templates built once, fixtures hand out shallow copies
+CREATE_TABLE_TEMPLATE = types.MappingProxyType(
+    {
         "db_name": Settings.TEST_DB_NAME,
         "table_name": Settings.TEST_TABLE_NAME,
         "table_schema": {"id": "INT PRIMARY KEY", "name": "VARCHAR(50)", "age": "INT"},
     }
+)
+
+INSERT_DATA_TEMPLATE = types.MappingProxyType(
+    {
+        "db_name": Settings.TEST_DB_NAME,
+        "table_name": Settings.TEST_TABLE_NAME,
+        "data": [
+            {"id": 1, "name": "John Doe", "age": 25},
+            {"id": 2, "name": "Jane Smith", "age": 30},
+        ],
+    }
+)
+
+# Prefix of API users created by tests, deleted on reset, never used by real accounts
+DISPOSABLE_USER_PREFIX = "pytest_user_"
+
+# Admin login form encoded once, token is requested with the raw body
+ADMIN_LOGIN_FORM = urllib.parse.urlencode(
+    {"username": Settings.API_ADM_USER, "password": Settings.API_ADM_PASSWORD}
+).encode()
+
+FORM_HEADERS = types.MappingProxyType({"Content-Type": "application/x-www-form-urlencoded"})
+
+
+@pytest.fixture
+def create_table_payload(request):
+    payload = dict(CREATE_TABLE_TEMPLATE)
 
     if hasattr(request, "param"):
         payload.update(request.param)
@@ -76,14 +135,7 @@ def create_table_payload(request):
 
 @pytest.fixture
 def insert_data_payload(request):
-    payload = {
-        "db_name": Settings.TEST_DB_NAME,
-        "table_name": Settings.TEST_TABLE_NAME,
-        "data": [
-            {"id": 1, "name": "John Doe", "age": 25},
-            {"id": 2, "name": "Jane Smith", "age": 30},
-        ],
-    }
+    payload = dict(INSERT_DATA_TEMPLATE)
 
     if hasattr(request, "param"):
         payload.update(request.param)
@@ -104,8 +156,9 @@ def db_user_payload():
     return payload
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_admin_user_payload(request):
+    # Session scope builds payload once per indirect param, read-only as it is shared
     payload = {
         "username": Settings.API_ADM_USER,
         "password": Settings.API_ADM_PASSWORD,
@@ -115,7 +168,7 @@ def api_admin_user_payload(request):
     if hasattr(request, "param"):
         payload.update(request.param)
 
-    return payload
+    return types.MappingProxyType(payload)
 
 
 @pytest.fixture
@@ -134,30 +187,118 @@ def api_non_admin_user_payload():
 # ------------------------------
 
 
-@pytest.fixture
-async def access_token(api_admin_user_payload):
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        logger.disabled = True  # Disable logger
-        logger.info("-------> Getting access_token")
-        response = await client.post("/get-token", data=api_admin_user_payload)
-        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
-        logger.info(f"-------> Access Token received: {headers}")
-        logger.disabled = False  # Enable logger
-    return headers
+@pytest.fixture(scope="session", autouse=True)
+def preload_app():
+    # Build OpenAPI schema up front, first request doesn't pay lazy schema generation
+    assert app.dependency_overrides[db_connect.get_db] is override_get_db
+    app.openapi()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging():
+    # Drop INFO and below for whole session, set once instead of toggling per fixture
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def warm_pool():
+    # Open all pool connections at once up front, first tests don't pay connect latency,
+    # session fixtures using test engine depend on this one, so engine is disposed after
+    # all their teardown has run
+    connections = await asyncio.gather(
+        *(test_engine.connect() for _ in range(test_engine.pool.size()))
+    )
+    await asyncio.gather(*(conn.close() for conn in connections))
+    yield
+    await test_engine.dispose()
+
+
+async def reset_test_state():
+    """
+    Drops test databases, test database user and disposable API users.
+
+    Tests create these objects as they run, so each session starts and ends without
+    leftovers from previous run. DDL commits implicitly in MySQL, so state is reset
+    once per session rather than rolled back per test.
+
+    Returns:
+        None
+    """
+
+    async with test_engine.begin() as conn:
+        for db_name in (Settings.TEST_DB_NAME, Settings.TEST_DB_NAME_2):
+            await conn.execute(text(f"DROP DATABASE IF EXISTS `{db_name}`"))
+        await conn.execute(
+            text("DROP USER IF EXISTS :username@:host"),
+            {"username": Settings.TEST_USER, "host": Settings.MYSQL_HOST},
+        )
+        await conn.run_sync(auth_models.Base.metadata.create_all, checkfirst=True)
+        disposable_users = auth_models.User.username.startswith(
+            DISPOSABLE_USER_PREFIX, autoescape=True
+        )
+        await conn.execute(delete(auth_models.User).where(disposable_users))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def clean_test_state(warm_pool):
+    await reset_test_state()
+    yield
+    await reset_test_state()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seed_users(clean_test_state):
+    # Insert admin and test user once with low-cost hashes, lifespan depends on this fixture
+    # so seeding runs before app startup and create_admin skips full-cost bcrypt hashing
+    fast_bcrypt = bcrypt.using(rounds=4)
+    users = [
+        (Settings.API_ADM_USER, Settings.API_ADM_PASSWORD, True),
+        (Settings.TEST_USER, Settings.TEST_PASSWORD, False),
+    ]
+    async with test_engine.begin() as conn:
+        for username, password, is_admin in users:
+            query = insert(auth_models.User).values(
+                username=username, hashed_password=fast_bcrypt.hash(password), is_admin=is_admin
+            )
+            # Existing users left unchanged, same as INSERT IGNORE
+            await conn.execute(query.on_duplicate_key_update(username=query.inserted.username))
+    yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def lifespan(seed_users):
+    # ASGITransport does not send lifespan events, run app startup and shutdown once per session
+    async with app.router.lifespan_context(app):
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(lifespan):
+    # One client for whole test session, avoids building transport per test,
+    # requesting it sets up test database state and app, unit tests skip both
+    async with ORJSONClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def access_token(client):
+    # Token requested once per session, avoids bcrypt verification per test,
+    # headers returned read-only as same mapping is passed by every test
+    response = await client.post("/get-token", content=ADMIN_LOGIN_FORM, headers=FORM_HEADERS)
+    return types.MappingProxyType({"Authorization": f"Bearer {response.json()['access_token']}"})
+
+
+@pytest_asyncio.fixture(scope="session")
+async def non_admin_access_token(client):
+    # Test user already inserted by seed_users, no registration round trip
+    payload = {"username": Settings.TEST_USER, "password": Settings.TEST_PASSWORD}
+    response = await client.post("/get-token", data=payload)
+    return types.MappingProxyType({"Authorization": f"Bearer {response.json()['access_token']}"})
 
 
 @pytest.fixture
-async def non_admin_access_token(access_token, api_non_admin_user_payload):
-    logger.disabled = True  # Disable logger
-    headers = await access_token
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        logger.disabled = True  # Disable logger
-        logger.info("-------> Getting non_admin_access_token")
-        response = await client.post(
-            "/register-api-user", json=api_non_admin_user_payload, headers=headers
-        )
-        response = await client.post("/get-token", data=api_non_admin_user_payload)
-        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
-        logger.info(f"-------> Non-Admin Access Token received: {headers}")
-        logger.disabled = False  # Enable logger
-        return headers
+def auth_headers(request):
+    # Headers of token fixture named by indirect param, resolved at setup outside test loop
+    return request.getfixturevalue(request.param)
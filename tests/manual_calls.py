@@ -1,6 +1,10 @@
-import requests
+import asyncio
+import sys
+
+import httpx
 
 from config import Settings
+from tests.clients import ORJSONClient
 
 # ------------------------------
 # Constants
@@ -9,127 +13,179 @@ from config import Settings
 BASE_URL = "http://localhost:8000"
 
 # ------------------------------
-# Access token
-# ------------------------------
-
-token_response = requests.post(
-    f"{BASE_URL}/get-token",
-    data={"username": Settings.API_ADM_USER, "password": Settings.API_ADM_PASSWORD},
-)
-
-access_token = token_response.json()["access_token"]
-headers = {"Authorization": f"Bearer {access_token}"}
-print(f"\nAccess token for user {Settings.API_ADM_USER} received\n")
-
-# ------------------------------
-# Register API User
-# ------------------------------
-
-response = requests.post(
-    f"{BASE_URL}/register-api-user",
-    json={"username": Settings.TEST_PASSWORD, "password": Settings.TEST_USER, "is_admin": True},
-    headers=headers,
-)
-response_json = response.json()
-print(f"Response register-api-user: {response_json}\n")
-
-
-# ------------------------------
-# Access token for API Test User
-# ------------------------------
-
-token_response = requests.post(
-    f"{BASE_URL}/get-token",
-    data={"username": Settings.TEST_PASSWORD, "password": Settings.TEST_USER},
-)
-
-access_token = token_response.json()["access_token"]
-headers = {"Authorization": f"Bearer {access_token}"}
-print(f"Access token for user {Settings.TEST_USER} received\n")
-
-
-# ------------------------------
-# Create Database
-# ------------------------------
-
-response = requests.post(
-    f"{BASE_URL}/create-database", json={"db_name": Settings.TEST_DB_NAME}, headers=headers
-)
-response_json = response.json()
-
-print(f"Response create-database: {response_json}\n")
-
-# ------------------------------
-# Register Database User
-# ------------------------------
-
-response = requests.post(
-    f"{BASE_URL}/create-db-user",
-    json={
-        "host": Settings.MYSQL_HOST,
-        "username": Settings.TEST_USER,
-        "password": Settings.TEST_PASSWORD,
-        "db_name": Settings.TEST_DB_NAME,
-        "privileges": "SELECT",
-    },
-    headers=headers,
-)
-response_json = response.json()
-print(f"Response register-db-user: {response_json}\n")
-
-# ------------------------------
-# Create Table
-# ------------------------------
-
-table_schema = {"id": "INT PRIMARY KEY", "name": "VARCHAR(50)", "age": "INT"}
-
-response = requests.post(
-    f"{BASE_URL}/create-table",
-    json={
-        "db_name": Settings.TEST_DB_NAME,
-        "table_name": Settings.TEST_TABLE_NAME,
-        "table_schema": table_schema,
-    },
-    headers=headers,
-)
-response_json = response.json()
-print(f"Response create-table: {response_json}\n")
-
-# ------------------------------
-# Insert Data
-# ------------------------------
-
-data_insert = [{"id": 1, "name": "None", "age": 25}, {"id": 2, "name": "Jane Smith", "age": 30}]
-
-response = requests.post(
-    f"{BASE_URL}/insert-data",
-    json={
-        "db_name": Settings.TEST_DB_NAME,
-        "table_name": Settings.TEST_TABLE_NAME,
-        "data": data_insert,
-    },
-    headers=headers,
-)
-response_json = response.json()
-print(f"Response insert-data: {response_json}\n")
-
-# ------------------------------
-# Fetch Table
-# ------------------------------
-
-response = requests.get(
-    f"{BASE_URL}/get-table/{Settings.TEST_DB_NAME}/{Settings.TEST_TABLE_NAME}", headers=headers
-)
-response_json = response.json()
-print(f"Response get-table: {response_json}\n")
-
-# ------------------------------
-# Delete Table
-# ------------------------------
-
-response = requests.delete(
-    f"{BASE_URL}/delete-table/{Settings.TEST_DB_NAME}/{Settings.TEST_TABLE_NAME}", headers=headers
-)
-
-response_json = response.json()
-print(f"Response delete-table: {response_json}\n")
+# Manual calls
+# ------------------------------
+
+
+async def run_flow(client, admin_user, admin_pw, test_user, test_pw):
+    """
+    Runs full endpoint flow once against running server and collects responses.
+    Calls depend on each other so run in order, except create-db-user and create-table.
+
+    Parameters:
+        client (httpx.AsyncClient): Client with base URL of running server.
+        admin_user (str): Username of admin API user.
+        admin_pw (str): Password of admin API user.
+        test_user (str): Username of API and database test user to create.
+        test_pw (str): Password of API and database test user to create.
+
+    Returns:
+        list[str]: Response lines, in call order.
+    """
+
+    log = []  # Output lines, written once by caller
+
+    # Settings read once into locals, reused by every call below
+    host, db_name, table_name = Settings.MYSQL_HOST, Settings.TEST_DB_NAME, Settings.TEST_TABLE_NAME
+
+    # ------------------------------
+    # Access token
+    # ------------------------------
+
+    token_response = await client.post(
+        "/get-token",
+        data={"username": admin_user, "password": admin_pw},
+    )
+
+    access_token = token_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+    log.append(f"\nAccess token for user {admin_user} received\n")
+
+    # ------------------------------
+    # Register API User
+    # ------------------------------
+
+    response = await client.post(
+        "/register-api-user",
+        json={
+            "username": test_user,
+            "password": test_pw,
+            "is_admin": True,
+        },
+        headers=headers,
+    )
+    response_json = response.json()
+    log.append(f"Response register-api-user: {response_json}\n")
+
+    # ------------------------------
+    # Access token for API Test User
+    # ------------------------------
+
+    token_response = await client.post(
+        "/get-token",
+        data={"username": test_user, "password": test_pw},
+    )
+
+    access_token = token_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+    log.append(f"Access token for user {test_user} received\n")
+
+    # ------------------------------
+    # Create Database
+    # ------------------------------
+
+    response = await client.post("/create-database", json={"db_name": db_name}, headers=headers)
+    response_json = response.json()
+
+    log.append(f"Response create-database: {response_json}\n")
+
+    # ------------------------------
+    # Register Database User and Create Table
+    # ------------------------------
+
+    # Both only need database to exist, send concurrently
+    table_schema = {"id": "INT PRIMARY KEY", "name": "VARCHAR(50)", "age": "INT"}
+
+    db_user_response, table_response = await asyncio.gather(
+        client.post(
+            "/create-db-user",
+            json={
+                "host": host,
+                "username": test_user,
+                "password": test_pw,
+                "db_name": db_name,
+                "privileges": "SELECT",
+            },
+            headers=headers,
+        ),
+        client.post(
+            "/create-table",
+            json={
+                "db_name": db_name,
+                "table_name": table_name,
+                "table_schema": table_schema,
+            },
+            headers=headers,
+        ),
+    )
+    log.append(f"Response register-db-user: {db_user_response.json()}\n")
+    log.append(f"Response create-table: {table_response.json()}\n")
+
+    # ------------------------------
+    # Insert Data
+    # ------------------------------
+
+    data_insert = [
+        {"id": 1, "name": "None", "age": 25},
+        {"id": 2, "name": "Jane Smith", "age": 30},
+    ]
+
+    response = await client.post(
+        "/insert-data",
+        json={
+            "db_name": db_name,
+            "table_name": table_name,
+            "data": data_insert,
+        },
+        headers=headers,
+    )
+    response_json = response.json()
+    log.append(f"Response insert-data: {response_json}\n")
+
+    # ------------------------------
+    # Fetch Table
+    # ------------------------------
+
+    response = await client.get(
+        f"/get-table/{db_name}/{table_name}",
+        headers=headers,
+    )
+    log.append(f"Response get-table: {response.text}\n")  # Newline delimited JSON rows
+
+    # ------------------------------
+    # Delete Table
+    # ------------------------------
+
+    response = await client.delete(
+        f"/delete-table/{db_name}/{table_name}",
+        headers=headers,
+    )
+
+    response_json = response.json()
+    log.append(f"Response delete-table: {response_json}\n")
+
+    return log
+
+
+async def main():
+    """
+    Runs endpoint flow once with configured users over keep-alive connections,
+    two so concurrent calls don't queue behind each other.
+    """
+
+    limits = httpx.Limits(max_connections=2, max_keepalive_connections=2)
+
+    async with ORJSONClient(base_url=BASE_URL, limits=limits) as client:
+        log = await run_flow(
+            client,
+            Settings.API_ADM_USER,
+            Settings.API_ADM_PASSWORD,
+            Settings.TEST_USER,
+            Settings.TEST_PASSWORD,
+        )
+
+    sys.stdout.write("\n".join(log) + "\n")  # Single write instead of flush per line
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+import asyncio
+import types
+
+import pytest
+
+from app.schemas import data_schemas
+from app.utils import insert_buffer
+from config import Settings
+
+# ------------------------------
+# Test buffer
+# ------------------------------
+
+DB = types.SimpleNamespace(bind=None)  # Request session, only its bind is read by buffer
+
+
+class RecordingBuffer(insert_buffer.InsertBuffer):
+    """
+    InsertBuffer recording writes instead of inserting, single inserts held until released.
+    """
+
+    def __init__(self, max_rows, fail_batch=False):
+        super().__init__(max_rows)
+        self.fail_batch = fail_batch
+        self.release = asyncio.Event()
+        self.calls = []
+
+    async def insert(self, bind, data_insert):
+        self.calls.append(("insert", [data_insert]))
+        await self.release.wait()
+        if any(row["id"] == "invalid" for row in data_insert.data):
+            raise ValueError("invalid row")
+        return {"rows": len(data_insert.data)}
+
+    async def insert_many(self, bind, data_inserts):
+        self.calls.append(("insert_many", data_inserts))
+        if self.fail_batch:
+            raise ValueError("batch failed")
+        return [{"rows": len(item.data)} for item in data_inserts]
+
+
+def table_data(*ids):
+    return data_schemas.TableData(
+        db_name=Settings.TEST_DB_NAME,
+        table_name=Settings.TEST_TABLE_NAME,
+        data=[{"id": row_id} for row_id in ids],
+    )
+
+
+async def settle():
+    # Let submit and flush tasks run until they block
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ------------------------------
+# Insert Buffer Tests
+# ------------------------------
+
+
+async def test_lone_insert_not_delayed():
+    buffer = RecordingBuffer(max_rows=100)
+    buffer.release.set()
+    data = table_data(1, 2)
+    result = await asyncio.wait_for(buffer.submit(DB, data), timeout=1)
+    assert result == {"rows": 2}
+    assert buffer.calls == [("insert", [data])]
+
+
+async def test_inserts_coalesced_behind_running_write():
+    buffer = RecordingBuffer(max_rows=100)
+    first_data, second_data, third_data = table_data(1), table_data(2, 3), table_data(4)
+    first = asyncio.create_task(buffer.submit(DB, first_data))
+    await settle()
+    second = asyncio.create_task(buffer.submit(DB, second_data))
+    third = asyncio.create_task(buffer.submit(DB, third_data))
+    await settle()
+    assert buffer.calls == [("insert", [first_data])]  # Later inserts wait for running write
+    buffer.release.set()
+    results = await asyncio.gather(first, second, third)
+    assert buffer.calls[1] == ("insert_many", [second_data, third_data])
+    assert results == [{"rows": 1}, {"rows": 2}, {"rows": 1}]  # Counts of own rows only
+
+
+async def test_max_rows_flushes_without_waiting():
+    buffer = RecordingBuffer(max_rows=2)
+    first_data, second_data = table_data(1), table_data(2, 3)
+    first = asyncio.create_task(buffer.submit(DB, first_data))
+    await settle()
+    second = asyncio.create_task(buffer.submit(DB, second_data))
+    await settle()
+    # Second batch reached max_rows, written while first write still running
+    assert buffer.calls == [("insert", [first_data]), ("insert", [second_data])]
+    buffer.release.set()
+    assert await asyncio.gather(first, second) == [{"rows": 1}, {"rows": 2}]
+
+
+async def test_failed_batch_retried_per_request():
+    buffer = RecordingBuffer(max_rows=100, fail_batch=True)
+    first_data, valid_data, invalid_data = table_data(1), table_data(2), table_data("invalid")
+    first = asyncio.create_task(buffer.submit(DB, first_data))
+    await settle()
+    valid = asyncio.create_task(buffer.submit(DB, valid_data))
+    invalid = asyncio.create_task(buffer.submit(DB, invalid_data))
+    await settle()
+    buffer.release.set()
+    assert await first == {"rows": 1}
+    assert await valid == {"rows": 1}
+    with pytest.raises(ValueError, match="invalid row"):
+        await invalid  # Only submitter of failing rows gets error
+    assert [call[0] for call in buffer.calls] == ["insert", "insert_many", "insert", "insert"]